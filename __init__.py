@@ -27,12 +27,229 @@ from bpy.props import StringProperty, BoolProperty, EnumProperty
 from bpy.types import Operator, Panel, AddonPreferences
 import os
 import json
+import platform
+import tempfile
+import re
+import subprocess
 import sys
+from datetime import datetime
+from functools import lru_cache
+import numpy as np
+
+# orjson parses/serializes measurably faster than stdlib json; entirely
+# optional, everything falls back to the stdlib module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# platform.system() can probe the OS on some systems - resolve it once
+_PLATFORM = platform.system()
+
+import ctypes
+
+
+class BITMAPINFOHEADER(ctypes.Structure):
+    """Win32 BITMAPINFOHEADER, written directly into the clipboard buffer"""
+    _fields_ = [
+        ('biSize', ctypes.c_uint32),
+        ('biWidth', ctypes.c_int32),
+        ('biHeight', ctypes.c_int32),
+        ('biPlanes', ctypes.c_uint16),
+        ('biBitCount', ctypes.c_uint16),
+        ('biCompression', ctypes.c_uint32),
+        ('biSizeImage', ctypes.c_uint32),
+        ('biXPelsPerMeter', ctypes.c_int32),
+        ('biYPelsPerMeter', ctypes.c_int32),
+        ('biClrUsed', ctypes.c_uint32),
+        ('biClrImportant', ctypes.c_uint32),
+    ]
+
+
+# Bind the Win32 clipboard entry points once at module load so each copy
+# doesn't redo the ctypes attribute walks, and declare pointer-sized
+# prototypes so HGLOBAL handles are not truncated on 64-bit Windows
+if sys.platform == 'win32':
+    _kernel32 = ctypes.windll.kernel32
+    _user32 = ctypes.windll.user32
+    _kernel32.GlobalAlloc.restype = ctypes.c_void_p
+    _kernel32.GlobalAlloc.argtypes = [ctypes.c_uint, ctypes.c_size_t]
+    _kernel32.GlobalLock.restype = ctypes.c_void_p
+    _kernel32.GlobalLock.argtypes = [ctypes.c_void_p]
+    _kernel32.GlobalUnlock.argtypes = [ctypes.c_void_p]
+    _kernel32.GlobalFree.argtypes = [ctypes.c_void_p]
+    _user32.OpenClipboard.argtypes = [ctypes.c_void_p]
+    _user32.OpenClipboard.restype = ctypes.c_int
+    _user32.EmptyClipboard.restype = ctypes.c_int
+    _user32.CloseClipboard.restype = ctypes.c_int
+    _user32.SetClipboardData.argtypes = [ctypes.c_uint, ctypes.c_void_p]
+    _user32.SetClipboardData.restype = ctypes.c_void_p
+else:
+    _kernel32 = None
+    _user32 = None
+
 
 # Global variables to store user preferences
 output_folder_path = ""
 filename_pattern = "(FileName)_(Camera)_frame_(Frame)"
 
+# Matches one frame-list segment: a single frame number or an inclusive
+# "start-end" range, with optional whitespace
+_FRAME_RANGE_RE = re.compile(r'\s*(\d+)\s*(?:-\s*(\d+)\s*)?')
+
+# Matches (Start:format) / (End:format) datetime tokens in filename patterns
+_DATETIME_TOKEN_RE = re.compile(r'\((Start|End):([^)]+)\)')
+
+# Translates the user-facing date placeholders to strftime directives in a
+# single substitution pass
+_STRFTIME_MAP = {'yyyy': '%Y', 'MM': '%m', 'dd': '%d', 'HH': '%H', 'mm': '%M', 'ss': '%S'}
+_STRFTIME_RE = re.compile('|'.join(_STRFTIME_MAP))
+
+# Video/stream formats that can't be used for still-frame output
+_DISALLOWED_STILL_FORMATS = frozenset({"FFMPEG", "AVI_JPEG", "AVI_RAW", "FRAMESERVER"})
+
+# Single-pass scrub of characters that are invalid in filenames
+_INVALID_FILENAME_TRANS = str.maketrans('<>:"/\\|?*', '_' * 9)
+
+# Placeholder that survives token expansion and sanitization, so a pattern
+# can be expanded once per batch and only the frame number filled in later
+_FRAME_SENTINEL = '\x00FRAME\x00'
+
+# Same idea for the (Channel) token, used when one frame is saved under
+# several channel names
+_CHANNEL_SENTINEL = '\x00CHANNEL\x00'
+
+# Extensions tried, in preference order, when the expected render output
+# is missing but a sibling format may exist
+_COMMON_EXTS = ('.png', '.jpg', '.jpeg', '.tif', '.tiff', '.exr', '.bmp')
+
+# Shared console banner separator
+_BANNER = "=" * 60
+
+# Set the FRH_DEBUG environment variable to enable verbose console output
+# (or toggle the add-on preference, which flips the same flag)
+_DEBUG = bool(os.environ.get('FRH_DEBUG'))
+
+
+def _set_debug(enabled):
+    """Sync the module verbosity flag with the add-on preference; the
+    environment variable always wins when set"""
+    global _DEBUG
+    _DEBUG = enabled or bool(os.environ.get('FRH_DEBUG'))
+
+# Maps Blender file formats (raw identifiers, so no .lower() at lookup
+# time) to still-image file extensions; anything unknown falls back to .png
+_FMT_EXT = {
+    'PNG': '.png',
+    'JPEG': '.jpg',
+    'JPEG2000': '.jp2',
+    'BMP': '.bmp',
+    'TARGA': '.tga',
+    'TARGA_RAW': '.tga',
+    'TIFF': '.tif',
+    'OPEN_EXR': '.exr',
+    'OPEN_EXR_MULTILAYER': '.exr',
+    'HDR': '.hdr',
+    'CINEON': '.cin',
+    'DPX': '.dpx',
+    'WEBP': '.webp',
+}
+
+# (path, basename) of the last output folder shown in the panel - draw()
+# runs on every UI redraw and should not redo string work for an
+# unchanged path
+_basename_cache = (None, "")
+
+# Directories already created this session - skips the stat+mkdir syscalls
+# that os.makedirs(exist_ok=True) performs on every call
+_ensured_dirs = set()
+
+
+def _ensure_dir(path):
+    """Create a directory once per session, remembering that it exists"""
+    if path and path not in _ensured_dirs:
+        os.makedirs(path, exist_ok=True)
+        _ensured_dirs.add(path)
+
+
+def _exists(path):
+    """Existence-only file check - access() skips the full stat buffer"""
+    return os.access(path, os.F_OK)
+
+
+@lru_cache(maxsize=16)
+def _abspath(path):
+    """Memoized bpy.path.abspath - the same few paths get resolved on
+    every operator call and panel redraw"""
+    return bpy.path.abspath(path) if path else path
+
+
+@lru_cache(maxsize=4)
+def _blend_name(blend_filepath):
+    """Blend file name without extension, or 'untitled' when unsaved.
+    Keyed on the path itself, so no handler invalidation is needed"""
+    if blend_filepath:
+        return os.path.splitext(os.path.basename(blend_filepath))[0]
+    return "untitled"
+
+
+# Panel preview filename memoized on its inputs - draw() runs on every UI
+# redraw and the preview only changes when one of them does. Patterns
+# without datetime tokens use the fixed placeholder time so the key never
+# churns; patterns with (Start:)/(End:) tokens preview with the current
+# time, bucketed to the minute in the cache key
+_preview_cache = (None, "")
+_PREVIEW_TIME = datetime(1970, 1, 1)
+
+
+# Directory listings keyed by folder path, validated against the folder's
+# mtime so repeated lookups on an unchanged directory skip the re-scan
+_dir_listing_cache = {}
+
+
+def _dir_entries(folder):
+    """Set of entry names in folder, read with one scandir pass and cached
+    until the directory's mtime changes"""
+    try:
+        mtime = os.stat(folder).st_mtime
+    except OSError:
+        return set()
+    cached = _dir_listing_cache.get(folder)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        with os.scandir(folder) as entries_iter:
+            entries = {entry.name for entry in entries_iter}
+    except OSError:
+        entries = set()
+    _dir_listing_cache[folder] = (mtime, entries)
+    return entries
+
+
+def _find_existing(folder, candidate_names):
+    """First candidate basename present in folder, resolved to a full
+    path. One scandir read replaces a stat call per candidate"""
+    try:
+        with os.scandir(folder) as entries_iter:
+            present = {entry.name for entry in entries_iter}
+    except OSError:
+        return None
+    for name in candidate_names:
+        if name in present:
+            return os.path.join(folder, name)
+    return None
+
+
+def _get_output_folder(blend_filepath):
+    """Resolve the effective output folder: the configured path if set,
+    otherwise the blend file's directory, otherwise the working directory"""
+    configured = output_folder_path.strip()
+    if configured:
+        return _abspath(configured)
+    if blend_filepath:
+        return os.path.dirname(_abspath(blend_filepath))
+    return os.getcwd()
+
 
 # Add-on Preferences Class
 class FurionRenderHelperPreferences(AddonPreferences):
@@ -49,13 +266,23 @@ class FurionRenderHelperPreferences(AddonPreferences):
         default='USER_PREFS',
         update=lambda self, context: load_output_folder_from_source(context)
     )
-    
+
+    verbose_logging: BoolProperty(
+        name="Verbose Console Logging",
+        description="Print per-frame render details to the system console (slows down large batches)",
+        default=False,
+        update=lambda self, context: _set_debug(self.verbose_logging)
+    )
+
     def draw(self, context):
         layout = self.layout
-        
+
         box = layout.box()
         box.label(text="Output Folder Path Storage:", icon='FOLDER_REDIRECT')
         box.prop(self, "output_path_source", expand=True)
+
+        layout.separator()
+        layout.prop(self, "verbose_logging")
         
         # Information about each option
         layout.separator()
@@ -85,6 +312,38 @@ def get_preferences_file():
     return os.path.join(user_data_dir, 'render_specific_frames_prefs.json')
 
 
+# In-memory cache of the preferences JSON so saves don't re-open and
+# re-parse the file before every write
+_prefs_cache = None
+
+# Snapshot of the preferences dict as last written to (or read from) disk,
+# used to skip rewriting the file when nothing actually changed
+_prefs_written = None
+
+
+def _get_prefs_cache():
+    """Load the preferences JSON into the module cache on first use"""
+    global _prefs_cache, _prefs_written
+    if _prefs_cache is None:
+        prefs_file = get_preferences_file()
+        try:
+            # One-shot binary read; opening directly instead of a prior
+            # exists() check saves a stat round-trip on slow mounts, and
+            # json.loads on the whole buffer skips the file-object
+            # chunked-read machinery of json.load
+            try:
+                with open(prefs_file, 'rb') as f:
+                    data = f.read()
+                _prefs_cache = orjson.loads(data) if orjson else json.loads(data)
+            except FileNotFoundError:
+                _prefs_cache = {}
+        except Exception as e:
+            print(f"Could not load preferences: {e}")
+            _prefs_cache = {}
+        _prefs_written = dict(_prefs_cache)
+    return _prefs_cache
+
+
 def get_addon_preferences():
     """Get the addon preferences"""
     try:
@@ -141,22 +400,14 @@ def save_output_folder_to_scene(scene=None):
 def load_output_folder_from_user_prefs():
     """Load output folder from user preferences JSON file"""
     global output_folder_path
-    prefs_file = get_preferences_file()
-    try:
-        if os.path.exists(prefs_file):
-            with open(prefs_file, 'r') as f:
-                prefs = json.load(f)
-                saved_folder = prefs.get('default_output_folder', '')
-                if saved_folder and os.path.exists(saved_folder):
-                    output_folder_path = saved_folder
-                    print(f"Loaded output folder from user preferences: {output_folder_path}")
-                else:
-                    output_folder_path = ""
-                    print("Saved output folder no longer exists, using default")
-        else:
-            output_folder_path = ""
-    except Exception as e:
-        print(f"Could not load output folder from user preferences: {e}")
+    prefs = _get_prefs_cache()
+    saved_folder = prefs.get('default_output_folder', '')
+    # No existence stat here - the render operators create the folder on
+    # demand, so a vanished path costs nothing until it's actually used
+    if saved_folder:
+        output_folder_path = saved_folder
+        print(f"Loaded output folder from user preferences: {output_folder_path}")
+    else:
         output_folder_path = ""
 
 
@@ -174,22 +425,19 @@ def load_output_folder_from_source(context=None):
 def load_user_preferences():
     """Load user preferences including output folder and filename pattern"""
     global output_folder_path, filename_pattern
-    prefs_file = get_preferences_file()
     try:
-        if os.path.exists(prefs_file):
-            with open(prefs_file, 'r') as f:
-                prefs = json.load(f)
-                
-                # Load filename pattern (always from user prefs)
-                saved_pattern = prefs.get('filename_pattern', '')
-                if saved_pattern:
-                    filename_pattern = saved_pattern
-                    print(f"Loaded filename pattern: {filename_pattern}")
-                else:
-                    print("Using default filename pattern")
-                
-                # Load output folder based on source setting
-                load_output_folder_from_source()
+        prefs = _get_prefs_cache()
+
+        # Load filename pattern (always from user prefs)
+        saved_pattern = prefs.get('filename_pattern', '')
+        if saved_pattern:
+            filename_pattern = saved_pattern
+            print(f"Loaded filename pattern: {filename_pattern}")
+        else:
+            print("Using default filename pattern")
+
+        # Load output folder based on source setting
+        load_output_folder_from_source()
     except Exception as e:
         print(f"Could not load preferences: {e}")
 
@@ -197,20 +445,30 @@ def load_default_output_folder():
     """Legacy function - now handled by load_user_preferences"""
     load_user_preferences()
 
+
+# Deferred-load guard: the prefs file is only read once something actually
+# needs the stored folder/pattern, not during add-on registration
+_prefs_loaded = False
+
+
+def _ensure_prefs_loaded():
+    """Load user preferences on first use"""
+    global _prefs_loaded
+    if not _prefs_loaded:
+        _prefs_loaded = True
+        load_user_preferences()
+
 def save_user_preferences():
     """Save user preferences including output folder and filename pattern"""
-    global output_folder_path, filename_pattern
+    global output_folder_path, filename_pattern, _prefs_written
     prefs_file = get_preferences_file()
     try:
         # Ensure the config directory exists
-        os.makedirs(os.path.dirname(prefs_file), exist_ok=True)
-        
-        # Load existing preferences or create new ones
-        prefs = {}
-        if os.path.exists(prefs_file):
-            with open(prefs_file, 'r') as f:
-                prefs = json.load(f)
-        
+        _ensure_dir(os.path.dirname(prefs_file))
+
+        # Mutate the cached preferences instead of re-reading the file
+        prefs = _get_prefs_cache()
+
         # Update filename pattern (always save to user prefs)
         prefs['filename_pattern'] = filename_pattern
         
@@ -226,10 +484,23 @@ def save_user_preferences():
             # Keep the old value in JSON for when user switches back
             # prefs['default_output_folder'] stays as-is
         
-        # Save preferences
-        with open(prefs_file, 'w') as f:
-            json.dump(prefs, f, indent=2)
-        
+        # Skip the disk write entirely when nothing changed since the last
+        # load or save - setting the same folder/pattern twice is common
+        if prefs == _prefs_written:
+            return
+
+        # Save preferences - write to a sibling temp file and rename so a
+        # crash mid-write can't leave a truncated prefs file behind
+        tmp_file = prefs_file + '.tmp'
+        if orjson:
+            payload = orjson.dumps(prefs, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(prefs, indent=2).encode('utf-8')
+        with open(tmp_file, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_file, prefs_file)
+        _prefs_written = dict(prefs)
+
         print(f"Saved preferences - pattern: {filename_pattern}")
     except Exception as e:
         print(f"Could not save preferences: {e}")
@@ -238,18 +509,67 @@ def save_default_output_folder():
     """Legacy function - now handled by save_user_preferences"""
     save_user_preferences()
 
-# Load user preferences on script load
-load_user_preferences()
+
+def _schedule_prefs_save():
+    """Write preferences after the current operator returns, so the disk IO
+    never sits on the UI thread's execute path"""
+    bpy.app.timers.register(save_user_preferences, first_interval=0.0)
+
+# Path Blender actually wrote during the most recent render, captured by
+# the render_write handler so post-render verification doesn't have to
+# guess and stat a list of candidate paths
+_last_written_path = [None]
+
+
+@bpy.app.handlers.persistent
+def on_render_write(scene):
+    """Handler called when a render result is written to disk"""
+    try:
+        _last_written_path[0] = scene.render.frame_path(frame=scene.frame_current)
+    except Exception:
+        _last_written_path[0] = None
 
 
 # Handler for when a blend file is loaded
 @bpy.app.handlers.persistent
 def on_file_load(dummy):
     """Handler called when a blend file is loaded"""
+    # Relative (//) paths resolve against the blend file, so the memoized
+    # resolutions are stale after a load
+    _abspath.cache_clear()
+    # Forget which output folders were ensured - a new project is a natural
+    # point to re-verify them, e.g. after an external cleanup
+    _ensured_dirs.clear()
     # Reload output folder based on current source setting
     load_output_folder_from_source()
 
 
+def _action_keyframes(action, frame_start=None, frame_end=None):
+    """Collect all keyframe frame numbers from an action as a set of ints,
+    optionally restricted to [frame_start, frame_end]"""
+    frame_arrays = []
+    for fcurve in action.fcurves:
+        count = len(fcurve.keyframe_points)
+        if not count:
+            continue
+        # foreach_get copies every (frame, value) pair in one C call instead
+        # of touching each keyframe_point from Python; the astype truncates
+        # the whole frame column in one vectorized pass, same semantics as
+        # a per-point int() cast
+        buf = np.empty(count * 2, dtype=np.float32)
+        fcurve.keyframe_points.foreach_get("co", buf)
+        frame_arrays.append(buf[0::2].astype(np.int32))
+    if not frame_arrays:
+        return set()
+    # Deduplicate in NumPy before boxing anything as a Python int, and
+    # drop out-of-range frames while they're still array elements so they
+    # never get boxed at all
+    merged = np.unique(np.concatenate(frame_arrays))
+    if frame_start is not None:
+        merged = merged[(merged >= frame_start) & (merged <= frame_end)]
+    return set(merged.tolist())
+
+
 def validate_channel_pattern(pattern, has_multiple_channels):
     """
     Validate if the filename pattern is compatible with multi-channel rendering
@@ -263,67 +583,81 @@ def validate_channel_pattern(pattern, has_multiple_channels):
     return True, ""
 
 
+# View-layer pass toggles and the channel name each one maps to, in the
+# order the channels are reported. Driven by one loop in
+# get_selected_channels instead of fourteen hand-written branches
+_PASS_TOGGLES = (
+    ('use_pass_z', 'Depth'),
+    ('use_pass_mist', 'Mist'),
+    ('use_pass_normal', 'Normal'),
+    ('use_pass_diffuse_direct', 'DiffuseDir'),
+    ('use_pass_glossy_direct', 'GlossyDir'),
+    ('use_pass_emit', 'Emit'),
+    ('use_pass_diffuse_color', 'DiffuseCol'),
+    ('use_pass_glossy_color', 'GlossyCol'),
+    ('use_pass_transmission_direct', 'TransDir'),
+    ('use_pass_transmission_color', 'TransCol'),
+    ('use_pass_ambient_occlusion', 'AO'),
+    ('use_pass_shadow', 'Shadow'),
+    ('use_pass_environment', 'Environment'),
+)
+
+
 def get_selected_channels(scene):
     """Get list of enabled render channels/passes from Blender's view layer settings"""
-    channels = []
-    
     # Get the first view layer (most common case)
-    view_layer = None
-    if scene.view_layers:
-        view_layer = scene.view_layers[0]
-    
+    view_layer = scene.view_layers[0] if scene.view_layers else None
+
     # If no view layer found, return Combined as fallback
     if not view_layer:
-        return [('Combined', 'Combined')]
-    
-    # Always include Combined pass (it's always available)
-    channels.append(('Combined', 'Combined'))
-    
-    # Check which passes are enabled in Blender's view layer settings
-    if view_layer.use_pass_z:
-        channels.append(('Depth', 'Depth'))
-    
-    if view_layer.use_pass_mist:
-        channels.append(('Mist', 'Mist'))
-    
-    if view_layer.use_pass_normal:
-        channels.append(('Normal', 'Normal'))
-    
-    if view_layer.use_pass_diffuse_direct:
-        channels.append(('DiffuseDir', 'DiffuseDir'))
-    
-    if view_layer.use_pass_glossy_direct:
-        channels.append(('GlossyDir', 'GlossyDir'))
-    
-    if view_layer.use_pass_emit:
-        channels.append(('Emit', 'Emit'))
-    
-    # Additional common passes
-    if view_layer.use_pass_diffuse_color:
-        channels.append(('DiffuseCol', 'DiffuseCol'))
-    
-    if view_layer.use_pass_glossy_color:
-        channels.append(('GlossyCol', 'GlossyCol'))
-    
-    if view_layer.use_pass_transmission_direct:
-        channels.append(('TransDir', 'TransDir'))
-    
-    if view_layer.use_pass_transmission_color:
-        channels.append(('TransCol', 'TransCol'))
-    
-    if view_layer.use_pass_ambient_occlusion:
-        channels.append(('AO', 'AO'))
-    
-    if view_layer.use_pass_shadow:
-        channels.append(('Shadow', 'Shadow'))
-    
-    if hasattr(view_layer, 'use_pass_environment') and view_layer.use_pass_environment:
-        channels.append(('Environment', 'Environment'))
-    
+        return ['Combined']
+
+    # Combined is always available; the rest follow the enabled toggles.
+    # getattr with a default covers toggles absent in older Blender builds
+    channels = ['Combined']
+    channels.extend(
+        name for attr, name in _PASS_TOGGLES
+        if getattr(view_layer, attr, False)
+    )
     return channels
 
 
-def save_render_pass(scene, channel_name, pass_name, filepath):
+# Channel name -> Blender's internal render-pass name
+_CHANNEL_TO_PASS = {
+    'Depth': 'Z',
+    'Mist': 'Mist',
+    'Normal': 'Normal',
+    'DiffuseDir': 'DiffDir',
+    'DiffuseCol': 'DiffCol',
+    'GlossyDir': 'GlossDir',
+    'GlossyCol': 'GlossCol',
+    'TransDir': 'TransDir',
+    'TransCol': 'TransCol',
+    'Emit': 'Emit',
+    'AO': 'AO',
+    'Shadow': 'Shadow',
+    'Environment': 'Env'
+}
+
+# Channel name -> render-layers node output socket name
+_CHANNEL_TO_SOCKET = {
+    'Depth': 'Depth',
+    'Mist': 'Mist',
+    'Normal': 'Normal',
+    'DiffuseDir': 'DiffDir',
+    'GlossyDir': 'GlossDir',
+    'Emit': 'Emit',
+    'DiffuseCol': 'DiffCol',
+    'GlossyCol': 'GlossCol',
+    'TransDir': 'TransDir',
+    'TransCol': 'TransCol',
+    'AO': 'AO',
+    'Shadow': 'Shadow',
+    'Environment': 'Env'
+}
+
+
+def save_render_pass(scene, channel_name, filepath):
     """Save a specific render pass to file by accessing render result data"""
     try:
         # Get the render result image
@@ -339,17 +673,7 @@ def save_render_pass(scene, channel_name, pass_name, filepath):
         
         # For specific passes, access them from the render result's pass data
         try:
-            # Map channel names to Blender's internal pass names
-            pass_name_mapping = {
-                'Depth': 'Z',
-                'Mist': 'Mist',
-                'Normal': 'Normal',
-                'DiffuseDir': 'DiffDir',
-                'GlossyDir': 'GlossDir',
-                'Emit': 'Emit'
-            }
-            
-            blender_pass_name = pass_name_mapping.get(channel_name, channel_name)
+            blender_pass_name = _CHANNEL_TO_PASS.get(channel_name, channel_name)
             
             # Try to access the pass data directly from render result
             # Check if the pass exists in render layers
@@ -379,10 +703,27 @@ def save_render_pass(scene, channel_name, pass_name, filepath):
                         alpha=True
                     )
                     
-                    # Copy the pass data to our temp image
-                    # Note: This is a simplified approach - actual pass extraction 
-                    # would require proper buffer manipulation
-                    temp_image.pixels = render_pass.rect[:]
+                    # Bulk-copy the pass data through a flat float32 buffer.
+                    # Slicing rect into a Python list and assigning .pixels
+                    # boxes/unboxes every float; foreach_get/foreach_set move
+                    # the whole plane in two C calls
+                    width, height = render_result.size
+                    pass_channels = render_pass.channels
+                    buf = np.empty(width * height * pass_channels, dtype=np.float32)
+                    render_pass.rect.foreach_get(buf)
+                    if pass_channels == 4:
+                        temp_image.pixels.foreach_set(buf)
+                    else:
+                        # Expand scalar/vector passes to RGBA for the image
+                        plane = buf.reshape(-1, pass_channels)
+                        rgba = np.empty((plane.shape[0], 4), dtype=np.float32)
+                        if pass_channels == 1:
+                            rgba[:, :3] = plane  # broadcast across RGB
+                        else:
+                            rgba[:, :3] = 0.0
+                            rgba[:, :pass_channels] = plane
+                        rgba[:, 3] = 1.0
+                        temp_image.pixels.foreach_set(rgba.reshape(-1))
                     temp_image.filepath_raw = filepath
                     temp_image.file_format = scene.render.image_settings.file_format
                     temp_image.save()
@@ -393,39 +734,22 @@ def save_render_pass(scene, channel_name, pass_name, filepath):
                     print(f"✓ Extracted and saved {channel_name} pass to: {filepath}")
                     return True
             
-            # If we couldn't extract the specific pass, fall back to a workaround
-            # Use the viewer node approach with minimal setup
-            return save_pass_via_viewer(scene, channel_name, blender_pass_name, filepath)
-                
+            # The pass data isn't reachable from here - report failure so
+            # the caller can re-render through the compositor instead of
+            # shipping combined pixels under the pass's filename
+            print(f"⚠️ {channel_name} pass not accessible on the render result")
+            return False
+
         except Exception as pass_error:
             print(f"⚠️ Error extracting {channel_name} pass: {pass_error}")
-            # Fall back to combined pass
-            render_result.save_render(filepath=filepath, scene=scene)
-            print(f"⚠️ Saved combined pass instead of {channel_name}")
-            return True
-            
-    except Exception as e:
-        print(f"❌ Error saving {channel_name} pass: {e}")
-        return False
-
+            return False
 
-def save_pass_via_viewer(scene, channel_name, blender_pass_name, filepath):
-    """Alternative method to save pass using viewer node approach"""
-    try:
-        # This is a simplified fallback - for now just save combined
-        # In a full implementation, this would set up compositor nodes temporarily
-        render_result = bpy.data.images.get('Render Result')
-        if render_result:
-            render_result.save_render(filepath=filepath, scene=scene)
-            print(f"⚠️ {channel_name} pass saved as combined (proper pass extraction not yet implemented)")
-            return True
-        return False
     except Exception as e:
-        print(f"❌ Error in viewer fallback for {channel_name}: {e}")
+        print(f"❌ Error saving {channel_name} pass: {e}")
         return False
 
 
-def setup_compositor_for_pass(scene, channel_name, pass_name):
+def setup_compositor_for_pass(scene, channel_name):
     """Set up compositor to output specific render pass"""
     # Store original state
     original_state = {
@@ -453,32 +777,11 @@ def setup_compositor_for_pass(scene, channel_name, pass_name):
         composite_node.location = (0, 0)
         original_state['created_nodes'].append(composite_node.name)
         
-        # Map channel names to socket names in Blender's compositor
-        socket_mapping = {
-            'Depth': 'Depth',
-            'Mist': 'Mist',
-            'Normal': 'Normal',
-            'DiffuseDir': 'DiffDir',
-            'GlossyDir': 'GlossDir',
-            'Emit': 'Emit',
-            'DiffuseCol': 'DiffCol',
-            'GlossyCol': 'GlossCol',
-            'TransDir': 'TransDir',
-            'TransCol': 'TransCol',
-            'AO': 'AO',
-            'Shadow': 'Shadow',
-            'Environment': 'Env'
-        }
-        
-        socket_name = socket_mapping.get(channel_name, channel_name)
-        
-        # Find and connect the appropriate output
-        output_socket = None
-        for output in render_layers_node.outputs:
-            if output.name == socket_name:
-                output_socket = output
-                break
-        
+        socket_name = _CHANNEL_TO_SOCKET.get(channel_name, channel_name)
+
+        # Collection lookup by name in C, not a Python scan over the sockets
+        output_socket = render_layers_node.outputs.get(socket_name)
+
         if output_socket:
             # Connect the specific pass to composite output
             scene.node_tree.links.new(output_socket, composite_node.inputs['Image'])
@@ -525,6 +828,12 @@ def restore_compositor_state(scene, original_state):
 def save_render_result(scene, filepath):
     """Save the current render result to file"""
     try:
+        # The fallback callers only get here when a just-finished render
+        # seemed unsaved; if Blender's own writer finished in the meantime
+        # the file is already there, and re-encoding it would double the
+        # cost for nothing. One stat is cheap insurance against that race
+        if _exists(filepath):
+            return True
         render_result = bpy.data.images.get('Render Result')
         if render_result:
             render_result.save_render(filepath=filepath, scene=scene)
@@ -535,6 +844,174 @@ def save_render_result(scene, filepath):
         return False
 
 
+def copy_render_result_to_windows_clipboard(scene):
+    """
+    Copy the current render result to the Windows clipboard as a CF_DIB bitmap.
+    Returns (success, message)
+    """
+    if sys.platform != 'win32':
+        return False, "Clipboard copy is only supported on Windows"
+
+    render_result = bpy.data.images.get('Render Result')
+    if not render_result:
+        return False, "No render result found - render a frame first"
+
+    temp_filepath = None
+    temp_image = None
+    try:
+        # Prefer reading the live render result pixels in memory - the
+        # disk round-trip below re-encodes and re-decodes the whole image
+        width, height = render_result.size
+        channels = render_result.channels
+        buf = None
+        rgba8 = None
+        if width > 0 and height > 0:
+            try:
+                candidate = np.empty(width * height * channels, dtype=np.float32)
+                render_result.pixels.foreach_get(candidate)
+                if candidate.any():
+                    buf = candidate
+            except Exception:
+                buf = None
+
+        if buf is None:
+            # The Render Result image often does not expose its pixels, so
+            # save it to a temporary file and reload it to get at the data.
+            # The file is deleted right after the reload, so skip PNG
+            # compression entirely - the encode work would be pure waste
+            temp_filepath = os.path.join(tempfile.gettempdir(), "frh_clipboard_temp.png")
+            image_settings = scene.render.image_settings
+            original_compression = None
+            if image_settings.file_format == 'PNG':
+                original_compression = image_settings.compression
+                image_settings.compression = 0
+            try:
+                render_result.save_render(filepath=temp_filepath, scene=scene)
+            finally:
+                if original_compression is not None:
+                    image_settings.compression = original_compression
+
+            # The temp PNG is 8-bit per channel; if Pillow happens to be
+            # available, decode it straight to uint8 and skip the float32
+            # round-trip through Image.pixels entirely
+            try:
+                from PIL import Image as PILImage
+                with PILImage.open(temp_filepath) as pil_image:
+                    pil_rgba = np.asarray(pil_image.convert('RGBA'), dtype=np.uint8)
+                width, height = pil_rgba.shape[1], pil_rgba.shape[0]
+                channels = 4
+                # PIL rows are top-down, the DIB wants bottom-up
+                rgba8 = np.flipud(pil_rgba).reshape(-1, 4)
+            except Exception:
+                rgba8 = None
+
+        if buf is None and rgba8 is None:
+            temp_image = bpy.data.images.load(temp_filepath)
+
+            width, height = temp_image.size
+            channels = temp_image.channels
+
+            # Read the pixel data straight into a preallocated NumPy buffer -
+            # foreach_get is a memcpy, while list(img.pixels) would box every
+            # float as a Python object
+            pixel_count = width * height * channels
+            buf = np.empty(pixel_count, dtype=np.float32)
+            if hasattr(temp_image.pixels, 'foreach_get'):
+                temp_image.pixels.foreach_get(buf)
+            else:
+                buf = np.fromiter(temp_image.pixels, dtype=np.float32, count=pixel_count)
+
+            # The buffer owns a copy of the data now, so drop the loaded
+            # image datablock right away instead of at the end
+            bpy.data.images.remove(temp_image)
+            temp_image = None
+
+        if rgba8 is None:
+            # Convert float RGBA (0..1) to 8-bit BGRA with NumPy - the
+            # per-pixel Python loop is far too slow for full-resolution
+            # renders. The float math runs in place on the read buffer so
+            # large renders only ever hold one full-size float buffer plus
+            # the uint8 output. Skipped entirely when the 8-bit fast path
+            # above already produced uint8 data
+            arr = buf.reshape(-1, channels)
+            if channels == 3:
+                alpha = np.full((arr.shape[0], 1), 1.0, dtype=np.float32)
+                arr = np.concatenate((arr, alpha), axis=1)
+            np.multiply(arr, 255.0, out=arr)
+            np.add(arr, 0.5, out=arr)
+            np.clip(arr, 0, 255, out=arr)
+            rgba8 = arr.astype(np.uint8)
+
+        # Swap R and B by viewing each pixel as a little-endian uint32 and
+        # masking/shifting - one vectorized pass instead of the fancy-indexed
+        # gather rgba8[:, [2, 1, 0, 3]], which allocates an intermediate.
+        # The swap is done in place on the uint32 view to avoid another
+        # full-image temporary
+        bgra_u32 = np.ascontiguousarray(rgba8).reshape(-1).view(np.uint32)
+        rb = bgra_u32 & np.uint32(0x00FF00FF)
+        bgra_u32 &= np.uint32(0xFF00FF00)
+        bgra_u32 |= rb << np.uint32(16)
+        rb >>= np.uint32(16)
+        bgra_u32 |= rb
+
+        user32 = _user32
+        kernel32 = _kernel32
+
+        GHND = 0x0042
+        CF_DIB = 8
+
+        header_size = ctypes.sizeof(BITMAPINFOHEADER)
+        total_size = header_size + bgra_u32.nbytes
+        if not user32.OpenClipboard(None):
+            return False, "Could not open the Windows clipboard"
+        try:
+            user32.EmptyClipboard()
+            hGlobal = kernel32.GlobalAlloc(GHND, total_size)
+            if not hGlobal:
+                return False, "GlobalAlloc failed for clipboard buffer"
+            pGlobal = kernel32.GlobalLock(hGlobal)
+            if not pGlobal:
+                # The handle is still ours - release it before bailing
+                kernel32.GlobalFree(hGlobal)
+                return False, "GlobalLock failed for clipboard buffer"
+            # Fill the header in place - a 32-bit bottom-up DIB (Blender's
+            # pixel rows are already bottom-up, so no flip is needed)
+            hdr = BITMAPINFOHEADER.from_address(pGlobal)
+            hdr.biSize = header_size
+            hdr.biWidth = width
+            hdr.biHeight = height
+            hdr.biPlanes = 1
+            hdr.biBitCount = 32
+            hdr.biCompression = 0
+            hdr.biSizeImage = width * height * 4
+            # Copy the pixel data straight out of the NumPy buffer - no
+            # intermediate bytearray, no second full-image copy
+            ctypes.memmove(pGlobal + header_size, bgra_u32.ctypes.data, bgra_u32.nbytes)
+            kernel32.GlobalUnlock(hGlobal)
+            # Ownership of hGlobal only transfers to the system on success;
+            # on failure it is still ours to free
+            if not user32.SetClipboardData(CF_DIB, hGlobal):
+                kernel32.GlobalFree(hGlobal)
+                return False, "SetClipboardData failed"
+        finally:
+            user32.CloseClipboard()
+
+        return True, f"Copied {width}x{height} render result to clipboard"
+
+    except Exception as e:
+        return False, f"Error copying render result to clipboard: {e}"
+
+    finally:
+        # Clean up the temporary image datablock and file
+        if temp_image:
+            bpy.data.images.remove(temp_image)
+        if temp_filepath and _exists(temp_filepath):
+            try:
+                os.remove(temp_filepath)
+            except Exception:
+                pass
+
+
 def generate_filename_from_pattern(pattern, blend_name, camera_name, frame_num, start_time=None, end_time=None, channel_name=None, view_layer_name=None):
     """
     Generate filename from pattern with token replacement
@@ -555,9 +1032,10 @@ def generate_filename_from_pattern(pattern, blend_name, camera_name, frame_num,
     yyyy-MM-dd = 2025-10-18
     yyyyMMdd_HH:mm:ss = 20251018_17:21:18
     """
-    import re
-    from datetime import datetime
-    
+    # Fast path: a pattern without any '(' has no tokens to expand
+    if '(' not in pattern:
+        return pattern.translate(_INVALID_FILENAME_TRANS)
+
     result = pattern
     
     # Replace basic tokens
@@ -570,11 +1048,19 @@ def generate_filename_from_pattern(pattern, blend_name, camera_name, frame_num,
     if "(Channel)" in result:
         result = result.replace("(Channel)", channel_name or "Combined")
     
-    # Replace datetime tokens with regex to handle custom formats
+    # Replace datetime tokens with regex to handle custom formats.
+    # Memoize per call so a token repeated in one pattern formats once
+    strftime_cache = {}
+
     def replace_datetime_token(match):
         token_type = match.group(1)  # "Start" or "End"
         datetime_format = match.group(2)  # Custom format string
-        
+
+        key = (token_type, datetime_format)
+        cached = strftime_cache.get(key)
+        if cached is not None:
+            return cached
+
         # Select the appropriate datetime
         if token_type == "Start" and start_time:
             dt = start_time
@@ -584,32 +1070,23 @@ def generate_filename_from_pattern(pattern, blend_name, camera_name, frame_num,
             # Use current time as fallback
             dt = datetime.now()
         
-        # Convert custom format to Python strftime format
-        py_format = datetime_format
-        # Replace common patterns
-        py_format = py_format.replace("yyyy", "%Y")
-        py_format = py_format.replace("MM", "%m") 
-        py_format = py_format.replace("dd", "%d")
-        py_format = py_format.replace("HH", "%H")
-        py_format = py_format.replace("mm", "%M")
-        py_format = py_format.replace("ss", "%S")
-        
+        # Convert custom format to Python strftime format in one pass
+        py_format = _STRFTIME_RE.sub(lambda m: _STRFTIME_MAP[m.group(0)], datetime_format)
+
+
         try:
-            return dt.strftime(py_format)
+            formatted = dt.strftime(py_format)
         except Exception as e:
             print(f"Warning: Invalid datetime format '{datetime_format}': {e}")
-            return dt.strftime("%Y%m%d_%H%M%S")  # Fallback format
+            formatted = dt.strftime("%Y%m%d_%H%M%S")  # Fallback format
+        strftime_cache[key] = formatted
+        return formatted
     
     # Replace Start and End tokens with format
-    result = re.sub(r'\((Start|End):([^)]+)\)', replace_datetime_token, result)
+    result = _DATETIME_TOKEN_RE.sub(replace_datetime_token, result)
     
-    # Clean up any remaining tokens or invalid characters for filenames
-    # Remove invalid filename characters
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        result = result.replace(char, '_')
-    
-    return result
+    # Clean up any remaining invalid filename characters in a single pass
+    return result.translate(_INVALID_FILENAME_TRANS)
 
 
 class RENDER_OT_set_output_folder(Operator):
@@ -629,13 +1106,15 @@ class RENDER_OT_set_output_folder(Operator):
     
     def execute(self, context):
         global output_folder_path
+        # The output folder is changing, so drop memoized resolutions
+        _abspath.cache_clear()
         if self.folder_path.strip():
-            output_folder_path = bpy.path.abspath(self.folder_path.strip())
-            # Ensure the folder exists
+            output_folder_path = _abspath(self.folder_path.strip())
+            # Ensure the folder exists (validated once per session)
             try:
-                os.makedirs(output_folder_path, exist_ok=True)
+                _ensure_dir(output_folder_path)
                 # Save as default preference
-                save_default_output_folder()
+                _schedule_prefs_save()
                 self.report({'INFO'}, f"Output folder set to: {output_folder_path}")
             except Exception as e:
                 self.report({'ERROR'}, f"Failed to create/access folder: {str(e)}")
@@ -644,13 +1123,14 @@ class RENDER_OT_set_output_folder(Operator):
             # Clear the output folder (use default)
             output_folder_path = ""
             # Save empty preference
-            save_default_output_folder()
+            _schedule_prefs_save()
             self.report({'INFO'}, "Output folder cleared (will use blend file directory)")
         
         return {'FINISHED'}
     
     def invoke(self, context, event):
         global output_folder_path
+        _ensure_prefs_loaded()
         self.folder_path = output_folder_path
         return context.window_manager.invoke_props_dialog(self, width=400)
     
@@ -694,18 +1174,19 @@ class RENDER_OT_set_filename_pattern(Operator):
         if self.pattern.strip():
             filename_pattern = self.pattern.strip()
             # Save as default preference
-            save_user_preferences()
+            _schedule_prefs_save()
             self.report({'INFO'}, f"Filename pattern set to: {filename_pattern}")
         else:
             # Reset to default
             filename_pattern = "(FileName)_(Camera)_frame_(Frame)"
-            save_user_preferences()
+            _schedule_prefs_save()
             self.report({'INFO'}, "Filename pattern reset to default")
         
         return {'FINISHED'}
     
     def invoke(self, context, event):
         global filename_pattern
+        _ensure_prefs_loaded()
         self.pattern = filename_pattern
         return context.window_manager.invoke_props_dialog(self, width=500)
     
@@ -771,189 +1252,169 @@ class RENDER_OT_specific_frames(Operator):
     _original_use_persistent_data = False
     _render_start_time = None
     _frame_start_time = None
+    _render_plan = []
+    _extension = ".png"
+    _format_name = "PNG"
+    _resolution_str = ""
+    _last_set_frame = None
+    _last_progress_bucket = -1
     
     def modal(self, context, event):
         if event.type == 'TIMER':
+            # Hoist the per-tick lookups into locals - each one is a Python
+            # attribute resolution (or RNA call) repeated several times below
+            num_frames = len(self._frame_numbers)
+            num_channels = len(self._selected_channels)
+
             # Check if we're done rendering all frames and channels
-            if self._current_frame_index >= len(self._frame_numbers):
+            if self._current_frame_index >= num_frames:
                 return self.finish_rendering(context)
-            
+
             # Check if we're done with all channels for current frame
-            if self._current_channel_index >= len(self._selected_channels):
+            if self._current_channel_index >= num_channels:
                 # Move to next frame
                 self._current_frame_index += 1
                 self._current_channel_index = 0
-                # Update UI
+                # Update UI - only the Properties editor hosts this add-on's
+                # progress. Filter the live area list each time: the user
+                # can close editors or switch workspaces mid-render, so a
+                # cached Area reference could dangle
                 for area in context.screen.areas:
-                    area.tag_redraw()
+                    if area.type == 'PROPERTIES':
+                        area.tag_redraw()
                 return {'PASS_THROUGH'}
             
-            # Get current frame and channel
-            frame_num = self._frame_numbers[self._current_frame_index]
-            channel_name, pass_name = self._selected_channels[self._current_channel_index]
+            # Get current frame and channel (frame_set wants a Python int,
+            # not a numpy scalar)
+            frame_num = int(self._frame_numbers[self._current_frame_index])
+            channel_name = self._selected_channels[self._current_channel_index]
             scene = context.scene
             render = scene.render
-            
-            # Set current frame
-            scene.frame_set(frame_num)
-            
-            # Get camera name for filename
-            camera_name = "NoCamera"
-            if scene.camera:
-                camera_name = scene.camera.name
-            
-            # Get view layer name
-            view_layer_name = scene.view_layers[0].name if scene.view_layers else "ViewLayer"
-            
-            # Record frame start time for filename patterns
-            from datetime import datetime
-            self._frame_start_time = datetime.now()
-            
-            # Generate filename using custom pattern with channel
-            global filename_pattern
-            # Only use channel name if pattern contains (Channel) token or multiple channels selected
-            if "(Channel)" in filename_pattern or len(self._selected_channels) > 1:
-                filename = generate_filename_from_pattern(
-                    filename_pattern,
-                    self._blend_filename,
-                    camera_name,
-                    frame_num,
-                    start_time=self._render_start_time,
-                    end_time=None,  # End time not available yet during rendering
-                    channel_name=channel_name,
-                    view_layer_name=view_layer_name
-                )
-            else:
-                filename = generate_filename_from_pattern(
-                    filename_pattern,
-                    self._blend_filename,
-                    camera_name,
-                    frame_num,
-                    start_time=self._render_start_time,
-                    end_time=None,  # End time not available yet during rendering
-                    channel_name=None,
-                    view_layer_name=view_layer_name
-                )
-            
-            # Get file extension from render settings
-            file_format = render.image_settings.file_format.lower()
-            if file_format == 'png':
-                extension = '.png'
-            elif file_format == 'jpeg':
-                extension = '.jpg'
-            elif file_format == 'tiff':
-                extension = '.tif'
-            elif file_format == 'exr':
-                extension = '.exr'
-            else:
-                extension = '.png'  # default
-            
+
+            # Set current frame - frame_set() triggers a full depsgraph
+            # evaluation, so skip it when the scene is already there (the
+            # channel passes of one frame, or a first frame that matches)
+            if frame_num != self._last_set_frame:
+                scene.frame_set(frame_num)
+                self._last_set_frame = frame_num
+
+            # Look up the precomputed filename and path for this frame/channel
+            filename, filepath_without_ext = self._render_plan[self._current_frame_index][self._current_channel_index]
+            extension = self._extension
+
             # Set full output path
-            full_output_path = os.path.join(self._output_folder, filename + extension)
-            filepath_without_ext = os.path.join(self._output_folder, filename)
-            render.use_file_extension = True
-            render.filepath = filepath_without_ext
+            full_output_path = filepath_without_ext + extension
             self._last_saved_path = full_output_path
             
             # Calculate total progress (frames * channels)
-            total_renders = len(self._frame_numbers) * len(self._selected_channels)
-            current_render = (self._current_frame_index * len(self._selected_channels)) + self._current_channel_index + 1
+            total_renders = num_frames * num_channels
+            current_render = (self._current_frame_index * num_channels) + self._current_channel_index + 1
             progress_percent = (current_render / total_renders) * 100
-            progress_bar = "█" * int(progress_percent / 5) + "░" * (20 - int(progress_percent / 5))
-            
-            print("=" * 60)
-            print(f"RENDERING PROGRESS: [{progress_bar}] {progress_percent:.1f}%")
-            print(f"Frame {self._current_frame_index + 1} of {len(self._frame_numbers)}")
-            print(f"Channel {self._current_channel_index + 1} of {len(self._selected_channels)} ({channel_name})")
-            print(f"Current Frame Number: {frame_num}")
-            print(f"Output File: {filename}{extension}")
-            print(f"Full Path: {full_output_path}")
-            print(f"Render Format: {render.image_settings.file_format}")
-            print(f"Resolution: {render.resolution_x}x{render.resolution_y}")
-            print("=" * 60)
+
+            # Only emit the progress banner when the 5% bucket advances, and
+            # write it as one buffered string - a dozen separate print calls
+            # per render flush an unbuffered console each time
+            bucket = int(progress_percent / 5)
+            if bucket != self._last_progress_bucket:
+                self._last_progress_bucket = bucket
+                progress_bar = "█" * bucket + "░" * (20 - bucket)
+                separator = "=" * 60
+                sys.stdout.write(
+                    f"{separator}\n"
+                    f"RENDERING PROGRESS: [{progress_bar}] {progress_percent:.1f}%\n"
+                    f"Frame {self._current_frame_index + 1} of {num_frames}\n"
+                    f"Channel {self._current_channel_index + 1} of {num_channels} ({channel_name})\n"
+                    f"Current Frame Number: {frame_num}\n"
+                    f"Output File: {filename}{extension}\n"
+                    f"Full Path: {full_output_path}\n"
+                    f"Render Format: {self._format_name}\n"
+                    f"Resolution: {self._resolution_str}\n"
+                    f"{separator}\n"
+                )
+                sys.stdout.flush()
             
             # Update progress in UI
             progress_msg = f"Rendering frame {frame_num} - {channel_name} ({current_render}/{total_renders}) -> {filename}{extension}"
             self.report({'INFO'}, progress_msg)
             
-            # Set up compositor for this specific pass if needed
-            original_compositor_state = setup_compositor_for_pass(scene, channel_name, pass_name)
-            
-            # Render the frame
-            print(f"Starting render of frame {frame_num} - {channel_name}...")
-            bpy.ops.render.render(write_still=True)
-            
-            # Check if the file was created - check multiple possible paths
-            file_created = False
-            actual_path = None
-            
-            # Check multiple possible file paths
-            possible_paths = [
-                full_output_path,  # Expected path
-                filepath_without_ext + extension,  # Path without explicit extension
-                filepath_without_ext + f"_{frame_num:04d}{extension}",  # With frame number
-                filepath_without_ext + f"{frame_num:04d}{extension}",  # Frame without underscore
-                full_output_path.replace(extension, f"_{frame_num:04d}{extension}"),  # Expected path with frame
-                full_output_path.replace(extension, f"{frame_num:04d}{extension}")  # Without underscore
-            ]
-            
-            # Also check uppercase extension variants
-            if extension.lower() != extension:
-                possible_paths.extend([
-                    p.replace(extension, extension.upper()) for p in possible_paths[:6]
-                ])
-            
-            for check_path in possible_paths:
-                if os.path.exists(check_path):
-                    file_created = True
-                    actual_path = check_path
-                    print(f"✓ Frame {frame_num} - {channel_name} rendered successfully at: {actual_path}")
-                    break
-            
-            if not file_created:
-                print(f"WARNING: Expected file not found. Checked paths:")
-                for check_path in possible_paths:
-                    print(f"  - {check_path}")
-                
-                # Try to save manually if automatic save failed
-                success = save_render_result(scene, full_output_path)
-                if success and os.path.exists(full_output_path):
-                    file_created = True
-                    actual_path = full_output_path
-                    print(f"✓ Frame {frame_num} - {channel_name} manually saved to: {actual_path}")
+            if self._current_channel_index == 0:
+                # Combined channel: a plain render with no compositor
+                # rewiring - Blender writes the file itself
+                render.filepath = filepath_without_ext
+                if _DEBUG:
+                    print(f"Starting render of frame {frame_num}...")
+                _last_written_path[0] = None
+                bpy.ops.render.render(write_still=True)
+
+                # Check if the file was created - the candidate basenames
+                # (expected name plus Blender's frame-number variants) were
+                # precomputed in execute() and are resolved against one
+                # directory read instead of a stat call per variant
+                candidate_names = self._candidate_plan[self._current_frame_index]
+
+                # The render_write handler knows the real path - try it first
+                if _last_written_path[0] and _exists(_last_written_path[0]):
+                    actual_path = _last_written_path[0]
+                else:
+                    actual_path = _find_existing(self._output_folder, candidate_names)
+                file_created = actual_path is not None
+
+                if file_created:
+                    if _DEBUG:
+                        print(f"✓ Frame {frame_num} - {channel_name} rendered successfully at: {actual_path}")
                 else:
+                    print(
+                        "WARNING: Expected file not found. Checked names:\n"
+                        + "\n".join(f"  - {name}" for name in candidate_names)
+                    )
+
+                    # Try to save manually if automatic save failed
+                    success = save_render_result(scene, full_output_path)
+                    if success and _exists(full_output_path):
+                        file_created = True
+                        actual_path = full_output_path
+                        print(f"✓ Frame {frame_num} - {channel_name} manually saved to: {actual_path}")
+                    else:
+                        print(f"❌ Failed to save frame {frame_num} - {channel_name}")
+            else:
+                # Secondary channels: the Python API exposes no pass data
+                # on the 'Render Result' image, so route the pass through
+                # the compositor and re-render - persistent data keeps the
+                # scene sync cheap, and Cycles reuses the frame's samples
+                # from the first render where it can
+                if _DEBUG:
+                    print(f"Rendering {channel_name} pass for frame {frame_num}...")
+                original_compositor_state = setup_compositor_for_pass(scene, channel_name)
+                render.filepath = filepath_without_ext
+                _last_written_path[0] = None
+                try:
+                    bpy.ops.render.render(write_still=True)
+                finally:
+                    restore_compositor_state(scene, original_compositor_state)
+
+                if _last_written_path[0] and _exists(_last_written_path[0]):
+                    saved = True
+                elif _exists(full_output_path):
+                    saved = True
+                else:
+                    saved = save_render_result(scene, full_output_path) and _exists(full_output_path)
+                if not saved:
                     print(f"❌ Failed to save frame {frame_num} - {channel_name}")
-            
-            
-            # Restore compositor state
-            restore_compositor_state(scene, original_compositor_state)
-            
-            # Move to next channel
+
+            # Move to next channel. The UI redraw happens once per
+            # completed frame (in the frame-advance branch above), not per
+            # channel - the progress readout only changes meaningfully then
             self._current_channel_index += 1
-            
-            # Update UI
-            for area in context.screen.areas:
-                area.tag_redraw()
-        
+
         elif event.type == 'ESC':
             return self.cancel_rendering(context)
         
         return {'PASS_THROUGH'}
     
-    def finish_rendering(self, context):
-        # Console completion message
-        channel_names = [ch[0] for ch in self._selected_channels]
-        total_renders = len(self._frame_numbers) * len(self._selected_channels)
-        print("\n" + "=" * 60)
-        print("🎉 RENDERING COMPLETED SUCCESSFULLY! 🎉")
-        print(f"✓ Total frames rendered: {len(self._frame_numbers)}")
-        print(f"✓ Render channels: {channel_names}")
-        print(f"✓ Total renders: {total_renders}")
-        print(f"✓ Output folder: {self._output_folder}")
-        print(f"✓ Frame numbers: {self._frame_numbers}")
-        print("=" * 60 + "\n")
-        
-        # Restore original frame and filepath
+    def _teardown(self, context):
+        """Restore every scene setting the batch touched and remove the
+        timer - one shared pass, so finish and cancel can never drift
+        apart when new saved state is added"""
         scene = context.scene
         scene.frame_set(self._original_frame)
         scene.render.filepath = self._original_filepath
@@ -962,54 +1423,58 @@ class RENDER_OT_specific_frames(Operator):
                 scene.render.image_settings.file_format = self._original_format
             except Exception:
                 pass
-        
-        # Restore original persistent data setting
         scene.render.use_persistent_data = self._original_use_persistent_data
         print(f"✓ Restored persistent data setting to: {self._original_use_persistent_data}")
-        
-        # Remove timer
-        wm = context.window_manager
-        wm.event_timer_remove(self._timer)
-        total_renders = len(self._frame_numbers) * len(self._selected_channels)
-        self.report({'INFO'}, f"Successfully rendered {len(self._frame_numbers)} frames with {len(self._selected_channels)} channels ({total_renders} total renders)")
+
+        context.window_manager.event_timer_remove(self._timer)
+
+    def finish_rendering(self, context):
+        # Console completion message
+        channel_names = self._selected_channels
+        num_frames = len(self._frame_numbers)
+        num_channels = len(self._selected_channels)
+        total_renders = num_frames * num_channels
+        print("\n" + "=" * 60)
+        print("🎉 RENDERING COMPLETED SUCCESSFULLY! 🎉")
+        print(f"✓ Total frames rendered: {num_frames}")
+        print(f"✓ Render channels: {channel_names}")
+        print(f"✓ Total renders: {total_renders}")
+        print(f"✓ Output folder: {self._output_folder}")
+        print(f"✓ Frame numbers: {self._frame_numbers}")
+        print("=" * 60 + "\n")
+
+        self._teardown(context)
+        self.report({'INFO'}, f"Successfully rendered {num_frames} frames with {num_channels} channels ({total_renders} total renders)")
         return {'FINISHED'}
-    
+
     def cancel_rendering(self, context):
         # Console cancellation message
-        completed_renders = (self._current_frame_index * len(self._selected_channels)) + self._current_channel_index
-        total_renders = len(self._frame_numbers) * len(self._selected_channels)
+        num_frames = len(self._frame_numbers)
+        num_channels = len(self._selected_channels)
+        completed_renders = (self._current_frame_index * num_channels) + self._current_channel_index
+        total_renders = num_frames * num_channels
         print("\n" + "=" * 60)
         print("⚠️  RENDERING CANCELLED BY USER ⚠️")
         print(f"✓ Renders completed: {completed_renders}/{total_renders}")
-        print(f"✓ Frames completed: {self._current_frame_index}/{len(self._frame_numbers)}")
+        print(f"✓ Frames completed: {self._current_frame_index}/{num_frames}")
         print(f"✓ Output folder: {self._output_folder}")
         print("=" * 60 + "\n")
-        
-        # Restore original frame and filepath
-        scene = context.scene
-        scene.frame_set(self._original_frame)
-        scene.render.filepath = self._original_filepath
-        if self._format_switched and self._original_format:
-            try:
-                scene.render.image_settings.file_format = self._original_format
-            except Exception:
-                pass
-        
-        # Restore original persistent data setting
-        scene.render.use_persistent_data = self._original_use_persistent_data
-        print(f"✓ Restored persistent data setting to: {self._original_use_persistent_data}")
-        
-        # Remove timer
-        wm = context.window_manager
-        wm.event_timer_remove(self._timer)
-        
-        completed_renders = (self._current_frame_index * len(self._selected_channels)) + self._current_channel_index
-        total_renders = len(self._frame_numbers) * len(self._selected_channels)
-        self.report({'WARNING'}, f"Rendering cancelled. Completed {completed_renders}/{total_renders} renders ({self._current_frame_index}/{len(self._frame_numbers)} frames)")
+
+        self._teardown(context)
+        self.report({'WARNING'}, f"Rendering cancelled. Completed {completed_renders}/{total_renders} renders ({self._current_frame_index}/{num_frames} frames)")
         return {'CANCELLED'}
     
     def execute(self, context):
         global output_folder_path
+
+        # Operators can run without the panel ever drawing (operator
+        # search, keymaps, scripts) - make sure the stored settings are in
+        _ensure_prefs_loaded()
+
+        # The dialog's draw() may have applied a pending suggestion but
+        # cannot clear the ID property itself - retire it here
+        context.window_manager.suggested_keyframes = ""
+
         # Parse the frame list
         try:
             frame_string = self.frame_list.strip()
@@ -1017,42 +1482,34 @@ class RENDER_OT_specific_frames(Operator):
                 self.report({'ERROR'}, "Please enter frame numbers")
                 return {'CANCELLED'}
             
-            # Split by comma and convert to integers or ranges
-            frame_numbers = []
+            # Match each comma-separated segment against the compiled
+            # single-frame-or-range pattern - one regex pass per segment
+            # instead of nested split/int/try-except
+            frame_set = set()
             for frame_str in frame_string.split(','):
-                frame_str = frame_str.strip()
-                if frame_str:
-                    try:
-                        # Check if it's a range (contains hyphen)
-                        if '-' in frame_str:
-                            # Handle range like "1-5" or "10-20"
-                            range_parts = frame_str.split('-')
-                            if len(range_parts) == 2:
-                                start_frame = int(range_parts[0].strip())
-                                end_frame = int(range_parts[1].strip())
-                                if start_frame <= end_frame:
-                                    # Add all frames in range (inclusive)
-                                    frame_numbers.extend(range(start_frame, end_frame + 1))
-                                else:
-                                    self.report({'ERROR'}, f"Invalid range: {frame_str} (start must be <= end)")
-                                    return {'CANCELLED'}
-                            else:
-                                self.report({'ERROR'}, f"Invalid range format: {frame_str}")
-                                return {'CANCELLED'}
-                        else:
-                            # Single frame number
-                            frame_num = int(frame_str)
-                            frame_numbers.append(frame_num)
-                    except ValueError:
-                        self.report({'ERROR'}, f"Invalid frame number or range: {frame_str}")
-                        return {'CANCELLED'}
-            
-            if not frame_numbers:
+                if not frame_str.strip():
+                    continue
+                match = _FRAME_RANGE_RE.fullmatch(frame_str)
+                if not match:
+                    self.report({'ERROR'}, f"Invalid frame number or range: {frame_str.strip()}")
+                    return {'CANCELLED'}
+                start_frame = int(match.group(1))
+                end_frame = int(match.group(2)) if match.group(2) else start_frame
+                if start_frame > end_frame:
+                    self.report({'ERROR'}, f"Invalid range: {frame_str.strip()} (start must be <= end)")
+                    return {'CANCELLED'}
+                # Add all frames in range (inclusive)
+                frame_set.update(range(start_frame, end_frame + 1))
+
+            if not frame_set:
                 self.report({'ERROR'}, "No valid frame numbers found")
                 return {'CANCELLED'}
-            
-            # Remove duplicates and sort
-            frame_numbers = sorted(list(set(frame_numbers)))
+
+            # The set already deduplicated; pack it into a sorted int32
+            # array - for big range inputs (1-100000) this is ~7x smaller
+            # than a list of boxed Python ints
+            frame_numbers = np.fromiter(frame_set, dtype=np.int32, count=len(frame_set))
+            frame_numbers.sort()
             
             # Get selected render channels from Blender's view layer
             scene = context.scene
@@ -1070,7 +1527,8 @@ class RENDER_OT_specific_frames(Operator):
             self._selected_channels = selected_channels
             self._current_frame_index = 0
             self._current_channel_index = 0
-            
+            self._last_progress_bucket = -1
+
             # Get current scene
             scene = context.scene
             
@@ -1085,9 +1543,12 @@ class RENDER_OT_specific_frames(Operator):
             scene.render.use_persistent_data = True
             print(f"✓ Enabled persistent data for batch rendering (was: {self._original_use_persistent_data})")
 
+            # Constant across the whole batch - set it once here instead of
+            # before every render in modal()
+            scene.render.use_file_extension = True
+
             # If current file format is a video/unsupported for still files, switch to PNG temporarily
-            disallowed_formats = {"FFMPEG", "AVI_JPEG", "AVI_RAW", "FRAMESERVER"}
-            if self._original_format in disallowed_formats:
+            if self._original_format in _DISALLOWED_STILL_FORMATS:
                 try:
                     scene.render.image_settings.file_format = 'PNG'
                     self._format_switched = True
@@ -1097,25 +1558,16 @@ class RENDER_OT_specific_frames(Operator):
             
             # Get the blend file name (without extension)
             blend_filepath = bpy.data.filepath
-            if blend_filepath:
-                self._blend_filename = os.path.splitext(os.path.basename(blend_filepath))[0]
-            else:
-                self._blend_filename = "untitled"
+            self._blend_filename = _blend_name(blend_filepath)
             
             # Set up output folder
+            self._output_folder = _get_output_folder(blend_filepath)
             if output_folder_path.strip():
-                self._output_folder = output_folder_path
-                # Ensure the folder exists
-                os.makedirs(self._output_folder, exist_ok=True)
-            else:
-                # Use default blend file directory or current directory
-                if blend_filepath:
-                    self._output_folder = os.path.dirname(bpy.path.abspath(blend_filepath))
-                else:
-                    self._output_folder = os.getcwd()
+                # Ensure the configured folder exists
+                _ensure_dir(self._output_folder)
             
             total_renders = len(frame_numbers) * len(selected_channels)
-            channel_names = [ch[0] for ch in selected_channels]
+            channel_names = selected_channels
             self.report({'INFO'}, f"Starting render of {len(frame_numbers)} frames with {len(selected_channels)} channels ({total_renders} total renders)")
             self.report({'INFO'}, f"Channels: {', '.join(channel_names)}")
             self.report({'INFO'}, f"Frames: {frame_numbers}")
@@ -1124,7 +1576,7 @@ class RENDER_OT_specific_frames(Operator):
             
             # Console startup message
             total_renders = len(frame_numbers) * len(selected_channels)
-            channel_names = [ch[0] for ch in selected_channels]
+            channel_names = selected_channels
             print("\n" + "=" * 60)
             print("🚀 STARTING BATCH RENDER PROCESS 🚀")
             print(f"📁 Output folder: {self._output_folder}")
@@ -1140,12 +1592,73 @@ class RENDER_OT_specific_frames(Operator):
             print("=" * 60 + "\n")
             
             # Record render start time for filename patterns
-            from datetime import datetime
             self._render_start_time = datetime.now()
-            
-            # Start modal operation with timer
+
+            # Precompute filenames for every frame/channel combination now -
+            # the modal timer callback should not rebuild pattern strings,
+            # re-read the camera name or re-derive the extension on each tick
+            camera_name = scene.camera.name if scene.camera else "NoCamera"
+            view_layer_name = scene.view_layers[0].name if scene.view_layers else "ViewLayer"
+
+            # Format and resolution don't change mid-batch - read the RNA
+            # properties once here rather than on every timer tick
+            self._format_name = scene.render.image_settings.file_format
+            self._extension = _FMT_EXT.get(self._format_name, '.png')
+            self._resolution_str = f"{scene.render.resolution_x}x{scene.render.resolution_y}"
+
+            # Expand the invariant tokens (file name, camera, start time,
+            # channel) once per channel; only the frame number varies across
+            # the batch, so each frame is a single sentinel substitution
+            use_channel_names = "(Channel)" in filename_pattern or len(selected_channels) > 1
+            protected_pattern = filename_pattern.replace("(Frame)", _FRAME_SENTINEL)
+            channel_templates = [
+                generate_filename_from_pattern(
+                    protected_pattern,
+                    self._blend_filename,
+                    camera_name,
+                    0,
+                    start_time=self._render_start_time,
+                    end_time=None,  # End time not available yet during rendering
+                    channel_name=channel_name if use_channel_names else None,
+                    view_layer_name=view_layer_name
+                )
+                for channel_name in selected_channels
+            ]
+            self._render_plan = []
+            for frame_num in frame_numbers:
+                frame_str = f"{frame_num:04d}"
+                per_channel = []
+                for template in channel_templates:
+                    filename = template.replace(_FRAME_SENTINEL, frame_str)
+                    # Join the folder in here too, so the modal callback only
+                    # concatenates the extension
+                    per_channel.append((filename, os.path.join(self._output_folder, filename)))
+                self._render_plan.append(per_channel)
+
+            # The candidate basenames probed after each render are pure
+            # string permutations of that frame's filename - build them all
+            # here, once, instead of re-running the f-string/replace chain
+            # on every timer tick
+            ext = self._extension
+            ext_upper = ext.upper() if ext.lower() != ext else None
+            self._candidate_plan = []
+            for frame_num, per_channel in zip(frame_numbers, self._render_plan):
+                first_filename = per_channel[0][0]
+                names = [
+                    first_filename + ext,  # Expected name
+                    f"{first_filename}_{frame_num:04d}{ext}",  # With frame number
+                    f"{first_filename}{frame_num:04d}{ext}",  # Frame without underscore
+                ]
+                if ext_upper:
+                    names.extend(name[:-len(ext)] + ext_upper for name in names[:3])
+                self._candidate_plan.append(names)
+
+            # Start modal operation with timer. Rendering itself is
+            # synchronous, so the timer only has to wake us between frames -
+            # 0.5 s keeps idle modal invocations (and their redraws) low
+            # without adding noticeable latency per frame
             wm = context.window_manager
-            self._timer = wm.event_timer_add(0.1, window=context.window)
+            self._timer = wm.event_timer_add(0.5, window=context.window)
             wm.modal_handler_add(self)
             
             return {'RUNNING_MODAL'}
@@ -1155,21 +1668,30 @@ class RENDER_OT_specific_frames(Operator):
             return {'CANCELLED'}
     
     def invoke(self, context, event):
+        # Consume a pending keyframe suggestion here - draw() must stay
+        # read-only, since writing ID properties from a draw callback
+        # raises in Blender
+        wm = context.window_manager
+        if wm.suggested_keyframes:
+            self.frame_list = wm.suggested_keyframes
+            # Clear the suggestion after applying
+            wm.suggested_keyframes = ""
+
         # Show dialog box for user input
-        return context.window_manager.invoke_props_dialog(self, width=400)
-    
+        return wm.invoke_props_dialog(self, width=400)
+
     def draw(self, context):
         global output_folder_path
         layout = self.layout
-        
-        # Check if we have suggested keyframes to apply
-        if hasattr(bpy.types.WindowManager, 'suggested_keyframes'):
-            suggested = bpy.types.WindowManager.suggested_keyframes
-            if suggested:
-                self.frame_list = suggested
-            # Clear the suggestion after applying
-            delattr(bpy.types.WindowManager, 'suggested_keyframes')
-        
+
+        # A suggestion triggered from the dialog's own button lands while
+        # we're open - apply it to the operator property (allowed during
+        # draw), but leave clearing the ID property to invoke()/execute():
+        # writing to ID classes inside a draw callback raises
+        wm = context.window_manager
+        if wm.suggested_keyframes:
+            self.frame_list = wm.suggested_keyframes
+
         # Show current output folder
         box = layout.box()
         if output_folder_path:
@@ -1209,6 +1731,7 @@ class RENDER_OT_current_frame(Operator):
 
     def execute(self, context):
         global output_folder_path, filename_pattern
+        _ensure_prefs_loaded()
         try:
             scene = context.scene
             render = scene.render
@@ -1229,26 +1752,17 @@ class RENDER_OT_current_frame(Operator):
 
             # Determine output folder
             blend_filepath = bpy.data.filepath
+            output_folder = _get_output_folder(blend_filepath)
             if output_folder_path.strip():
-                output_folder = bpy.path.abspath(output_folder_path.strip())
-                os.makedirs(output_folder, exist_ok=True)
-            else:
-                if blend_filepath:
-                    output_folder = os.path.dirname(bpy.path.abspath(blend_filepath))
-                else:
-                    output_folder = os.getcwd()
+                _ensure_dir(output_folder)
 
             # Determine blend name and frame
-            if blend_filepath:
-                blend_name = os.path.splitext(os.path.basename(blend_filepath))[0]
-            else:
-                blend_name = "untitled"
+            blend_name = _blend_name(blend_filepath)
             frame_num = scene.frame_current
 
             # File extension from render format
             # Ensure an image-capable format
-            disallowed_formats = {"FFMPEG", "AVI_JPEG", "AVI_RAW", "FRAMESERVER"}
-            if original_format in disallowed_formats:
+            if original_format in _DISALLOWED_STILL_FORMATS:
                 try:
                     render.image_settings.file_format = 'PNG'
                     format_switched = True
@@ -1256,17 +1770,7 @@ class RENDER_OT_current_frame(Operator):
                 except Exception as e:
                     self.report({'WARNING'}, f"Could not switch format from {original_format}; output may not save correctly: {e}")
 
-            fmt = render.image_settings.file_format.lower()
-            if fmt == 'png':
-                extension = '.png'
-            elif fmt == 'jpeg':
-                extension = '.jpg'
-            elif fmt == 'tiff':
-                extension = '.tif'
-            elif fmt == 'exr':
-                extension = '.exr'
-            else:
-                extension = '.png'
+            extension = _FMT_EXT.get(render.image_settings.file_format, '.png')
 
             # Get camera name
             camera_name = "NoCamera"
@@ -1276,53 +1780,49 @@ class RENDER_OT_current_frame(Operator):
             # Get view layer name
             view_layer_name = scene.view_layers[0].name if scene.view_layers else "ViewLayer"
 
-            # Console info
-            print("\n" + "=" * 60)
-            print("🎯 RENDER CURRENT FRAME")
-            print(f"📁 Output folder: {output_folder}")
-            print(f"🎬 Blend file: {blend_name}")
-            print(f"📷 Camera: {camera_name}")
-            print(f"🧭 Frame: {frame_num}")
-            print(f"🖼️  Format: {render.image_settings.file_format}")
-            print(f"🎭 Channels: {[ch[0] for ch in selected_channels]}")
-            print("=" * 60 + "\n")
+            # Console info - one print call builds one string
+            print(
+                f"\n{_BANNER}\n"
+                f"🎯 RENDER CURRENT FRAME\n"
+                f"📁 Output folder: {output_folder}\n"
+                f"🎬 Blend file: {blend_name}\n"
+                f"📷 Camera: {camera_name}\n"
+                f"🧭 Frame: {frame_num}\n"
+                f"🖼️  Format: {render.image_settings.file_format}\n"
+                f"🎭 Channels: {selected_channels}\n"
+                f"{_BANNER}\n"
+            )
 
             # Render and save each channel
-            from datetime import datetime
             render_time = datetime.now()
             saved_paths = []
 
-            for channel_name, pass_name in selected_channels:
-                # Generate filename for this channel - only use channel name if pattern contains (Channel) token
-                if "(Channel)" in filename_pattern or len(selected_channels) > 1:
-                    # Use channel name in filename
-                    filename = generate_filename_from_pattern(
-                        filename_pattern,
-                        blend_name,
-                        camera_name,
-                        frame_num,
-                        start_time=render_time,
-                        end_time=render_time,
-                        channel_name=channel_name,
-                        view_layer_name=view_layer_name
-                    )
+            # Expand the invariant tokens once - only the (Channel) token
+            # varies across the loop, so each channel costs a single string
+            # replace on the shared name instead of a full pattern parse
+            # (the same sentinel trick the batch operator uses for frames)
+            has_channel_token = "(Channel)" in filename_pattern
+            base_filename = generate_filename_from_pattern(
+                filename_pattern,
+                blend_name,
+                camera_name,
+                frame_num,
+                start_time=render_time,
+                end_time=render_time,
+                channel_name=_CHANNEL_SENTINEL if has_channel_token else None,
+                view_layer_name=view_layer_name
+            )
+
+            for channel_name in selected_channels:
+                if has_channel_token:
+                    filename = base_filename.replace(_CHANNEL_SENTINEL, channel_name)
                 else:
-                    # Don't use channel name - for single Combined pass without (Channel) token
-                    filename = generate_filename_from_pattern(
-                        filename_pattern,
-                        blend_name,
-                        camera_name,
-                        frame_num,
-                        start_time=render_time,
-                        end_time=render_time,
-                        channel_name=None,  # This will default to "Combined" but won't be used
-                        view_layer_name=view_layer_name
-                    )
-                
+                    filename = base_filename
+
                 full_output_path = os.path.join(output_folder, filename + extension)
 
                 # Set up compositor for this specific pass
-                original_compositor_state = setup_compositor_for_pass(scene, channel_name, pass_name)
+                original_compositor_state = setup_compositor_for_pass(scene, channel_name)
                 
                 # Set filepath WITHOUT extension (Blender will add it)
                 filepath_without_ext = os.path.join(output_folder, filename)
@@ -1330,40 +1830,40 @@ class RENDER_OT_current_frame(Operator):
                 render.use_file_extension = True
                 
                 # Render
+                _last_written_path[0] = None
                 bpy.ops.render.render(write_still=True)
 
-                # Blender automatically saves the file, check multiple possible paths
-                possible_paths = [
-                    full_output_path,  # Our expected path
-                    filepath_without_ext + extension,  # Path without extension + extension
-                    filepath_without_ext + extension.upper(),  # Uppercase extension
+                # Blender automatically saves the file - resolve the expected
+                # name and its frame-number/uppercase variants with a single
+                # directory read instead of a stat call per candidate
+                candidate_names = [
+                    filename + extension,  # Our expected name
+                    filename + extension.upper(),  # Uppercase extension
+                    f"{filename}_{frame_num:04d}{extension}",  # With frame number
+                    f"{filename}{frame_num:04d}{extension}",  # Frame without underscore
                 ]
-                
-                # Add frame number variations (Blender might add frame numbers)
-                for base_path in [full_output_path, filepath_without_ext + extension]:
-                    possible_paths.append(base_path.replace(extension, f"_{frame_num:04d}{extension}"))
-                    possible_paths.append(base_path.replace(extension, f"{frame_num:04d}{extension}"))
-                
-                file_found = False
-                actual_path = None
-                for path in possible_paths:
-                    if os.path.exists(path):
-                        file_found = True
-                        actual_path = path
-                        saved_paths.append(path)
-                        print(f"✓ Saved {channel_name} to: {path}")
-                        break
-                
-                if not file_found:
+
+                # The render_write handler knows the real path - try it first
+                if _last_written_path[0] and _exists(_last_written_path[0]):
+                    actual_path = _last_written_path[0]
+                else:
+                    actual_path = _find_existing(output_folder, candidate_names)
+
+                if actual_path:
+                    saved_paths.append(actual_path)
+                    print(f"✓ Saved {channel_name} to: {actual_path}")
+                else:
                     # Last resort - try manual save
                     success = save_render_result(scene, full_output_path)
                     if success and os.path.exists(full_output_path):
                         saved_paths.append(full_output_path)
                         print(f"✓ Manually saved {channel_name} to: {full_output_path}")
                     else:
-                        print(f"❌ Failed to save {channel_name}")
-                        print(f"   Expected at: {full_output_path}")
-                        print(f"   Tried paths: {possible_paths}")
+                        sys.stdout.write(
+                            f"❌ Failed to save {channel_name}\n"
+                            f"   Expected at: {full_output_path}\n"
+                            f"   Tried names: {candidate_names}\n"
+                        )
                 
                 # Restore compositor state
                 restore_compositor_state(scene, original_compositor_state)
@@ -1376,6 +1876,16 @@ class RENDER_OT_current_frame(Operator):
                 except Exception:
                     pass
 
+            # Optionally copy the render result to the clipboard (Windows
+            # only) - the property is always registered, so read it directly
+            # instead of through getattr's exception-swallowing default
+            if scene.frh_copy_to_clipboard:
+                clip_success, clip_message = copy_render_result_to_windows_clipboard(scene)
+                if clip_success:
+                    print(f"✓ {clip_message}")
+                else:
+                    print(f"⚠️ {clip_message}")
+
             if saved_paths:
                 self.report({'INFO'}, f"Saved {len(saved_paths)} channel(s) for current frame")
                 return {'FINISHED'}
@@ -1388,6 +1898,35 @@ class RENDER_OT_current_frame(Operator):
             return {'CANCELLED'}
 
 
+class RENDER_OT_copy_to_clipboard(Operator):
+    """Copy the current render result to the system clipboard"""
+    bl_idname = "render.copy_to_clipboard"
+    bl_label = "Copy Render to Clipboard"
+    bl_description = "Copy the current render result to the clipboard as an image (Windows only)"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        success, message = copy_render_result_to_windows_clipboard(context.scene)
+
+        # One buffered write covering the banner and the outcome, instead of
+        # a sequence of individual console flushes
+        status = "✓" if success else "❌"
+        sys.stdout.write(
+            f"\n{_BANNER}\n"
+            f"📋 COPY RENDER RESULT TO CLIPBOARD\n"
+            f"Platform: {sys.platform}\n"
+            f"{status} {message}\n"
+            f"{_BANNER}\n"
+        )
+
+        if success:
+            self.report({'INFO'}, message)
+            return {'FINISHED'}
+        else:
+            self.report({'ERROR'}, message)
+            return {'CANCELLED'}
+
+
 class RENDER_OT_browse_output_folder(Operator):
     """Open the output folder in file explorer"""
     bl_idname = "render.browse_output_folder"
@@ -1397,17 +1936,12 @@ class RENDER_OT_browse_output_folder(Operator):
 
     def execute(self, context):
         global output_folder_path
+        _ensure_prefs_loaded()
         try:
             blend_filepath = bpy.data.filepath
-            
+
             # Determine output folder
-            if output_folder_path.strip():
-                folder_to_open = bpy.path.abspath(output_folder_path.strip())
-            else:
-                if blend_filepath:
-                    folder_to_open = os.path.dirname(bpy.path.abspath(blend_filepath))
-                else:
-                    folder_to_open = os.getcwd()
+            folder_to_open = _get_output_folder(blend_filepath)
 
             # Check if folder exists
             if not os.path.exists(folder_to_open):
@@ -1415,17 +1949,14 @@ class RENDER_OT_browse_output_folder(Operator):
                 return {'CANCELLED'}
 
             # Open the folder using platform-specific method
-            import subprocess
-            import platform
-
-            system = platform.system()
+            system = _PLATFORM
             try:
                 if system == "Windows":
                     os.startfile(folder_to_open)
                 elif system == "Darwin":  # macOS
-                    subprocess.Popen(["open", folder_to_open])
+                    subprocess.Popen(["open", folder_to_open], start_new_session=True)
                 else:  # Linux and others
-                    subprocess.Popen(["xdg-open", folder_to_open])
+                    subprocess.Popen(["xdg-open", folder_to_open], start_new_session=True)
                 
                 self.report({'INFO'}, f"Opened folder: {folder_to_open}")
                 return {'FINISHED'}
@@ -1448,18 +1979,13 @@ class RENDER_OT_open_output_folder(Operator):
 
     def execute(self, context):
         global output_folder_path
+        _ensure_prefs_loaded()
         try:
             scene = context.scene
             blend_filepath = bpy.data.filepath
-            
+
             # Determine output folder
-            if output_folder_path.strip():
-                folder_to_open = bpy.path.abspath(output_folder_path.strip())
-            else:
-                if blend_filepath:
-                    folder_to_open = os.path.dirname(bpy.path.abspath(blend_filepath))
-                else:
-                    folder_to_open = os.getcwd()
+            folder_to_open = _get_output_folder(blend_filepath)
 
             # Check if folder exists
             if not os.path.exists(folder_to_open):
@@ -1467,11 +1993,8 @@ class RENDER_OT_open_output_folder(Operator):
                 return {'CANCELLED'}
 
             # Get current frame file info for better user feedback
-            if blend_filepath:
-                blend_name = os.path.splitext(os.path.basename(blend_filepath))[0]
-            else:
-                blend_name = "untitled"
-            
+            blend_name = _blend_name(blend_filepath)
+
             frame_num = scene.frame_current
             camera_name = "NoCamera"
             if scene.camera:
@@ -1481,52 +2004,47 @@ class RENDER_OT_open_output_folder(Operator):
             view_layer_name = scene.view_layers[0].name if scene.view_layers else "ViewLayer"
 
             # Determine file extension from render settings
-            fmt = scene.render.image_settings.file_format.lower()
-            if fmt == 'png':
-                extension = '.png'
-            elif fmt == 'jpeg':
-                extension = '.jpg'
-            elif fmt == 'tiff':
-                extension = '.tif'
-            elif fmt == 'exr':
-                extension = '.exr'
-            else:
-                extension = '.png'
+            extension = _FMT_EXT.get(scene.render.image_settings.file_format, '.png')
 
             # Generate expected filename using the current pattern
-            from datetime import datetime
             global filename_pattern
+            now = datetime.now()  # We don't know the exact render time, use current
             expected_filename_base = generate_filename_from_pattern(
                 filename_pattern,
                 blend_name,
                 camera_name,
                 frame_num,
-                start_time=datetime.now(),  # We don't know the exact render time, use current
-                end_time=datetime.now(),
+                start_time=now,
+                end_time=now,
                 view_layer_name=view_layer_name
             )
             expected_filename = expected_filename_base + extension
             expected_filepath = os.path.join(folder_to_open, expected_filename)
 
-            # Console info
-            print("\n" + "=" * 60)
-            print("�️  OPENING RENDERED FRAME RESULT")
-            print(f"Current timeline frame: {frame_num}")
-            print(f"Looking for file: {expected_filename}")
-            print(f"Full path: {expected_filepath}")
+            # Console info - one print call builds one string
+            print(
+                f"\n{_BANNER}\n"
+                f"🖼️  OPENING RENDERED FRAME RESULT\n"
+                f"Current timeline frame: {frame_num}\n"
+                f"Looking for file: {expected_filename}\n"
+                f"Full path: {expected_filepath}"
+            )
             
+            # Read the directory once and check candidates against it in
+            # memory - probing each extension with os.path.exists would cost
+            # a stat syscall apiece, painful on network-synced folders
+            entries = _dir_entries(folder_to_open)
+
             # Check if the rendered file exists
-            if not os.path.exists(expected_filepath):
+            if expected_filename not in entries:
                 # Try alternative extensions/formats that might exist
                 alternative_files = []
                 base_name = expected_filename_base  # Use the pattern-generated base name
-                common_extensions = ['.png', '.jpg', '.jpeg', '.tif', '.tiff', '.exr', '.bmp']
-                
-                for ext in common_extensions:
-                    alt_path = os.path.join(folder_to_open, base_name + ext)
-                    if os.path.exists(alt_path):
-                        alternative_files.append(alt_path)
-                
+
+                for ext in _COMMON_EXTS:
+                    if base_name + ext in entries:
+                        alternative_files.append(os.path.join(folder_to_open, base_name + ext))
+
                 if alternative_files:
                     expected_filepath = alternative_files[0]  # Use the first found file
                     expected_filename = os.path.basename(expected_filepath)
@@ -1542,18 +2060,18 @@ class RENDER_OT_open_output_folder(Operator):
             print("=" * 60 + "\n")
 
             # Open the specific image file using platform-specific method
-            import subprocess
-            import platform
-
-            system = platform.system()
+            system = _PLATFORM
             try:
                 if system == "Windows":
-                    # Use the default program to open the image file
-                    subprocess.run(['start', '', expected_filepath], shell=True, check=True)
+                    # ShellExecute directly - spawning cmd.exe via
+                    # 'start' just to reach the same API is pure overhead
+                    os.startfile(expected_filepath)
                 elif system == "Darwin":  # macOS
-                    subprocess.run(['open', expected_filepath], check=True)
+                    # Fire and forget - blocking on the viewer's exit would
+                    # stall Blender's main thread for no benefit
+                    subprocess.Popen(['open', expected_filepath], start_new_session=True)
                 elif system == "Linux":
-                    subprocess.run(['xdg-open', expected_filepath], check=True)
+                    subprocess.Popen(['xdg-open', expected_filepath], start_new_session=True)
                 else:
                     self.report({'ERROR'}, f"Unsupported operating system: {system}")
                     return {'CANCELLED'}
@@ -1597,33 +2115,27 @@ class RENDER_OT_suggest_keyframes(Operator):
         
         if self.current_frames.strip():
             try:
-                frame_numbers = []
-                frame_string = self.current_frames.strip()
-                
-                # Parse the frame list (same logic as the render operator)
-                for frame_str in frame_string.split(','):
-                    frame_str = frame_str.strip()
-                    if frame_str:
-                        try:
-                            # Check if it's a range (contains hyphen)
-                            if '-' in frame_str:
-                                # Handle range like "1-5" or "10-20"
-                                range_parts = frame_str.split('-')
-                                if len(range_parts) == 2:
-                                    start_frame = int(range_parts[0].strip())
-                                    end_frame = int(range_parts[1].strip())
-                                    if start_frame <= end_frame:
-                                        frame_numbers.extend(range(start_frame, end_frame + 1))
-                            else:
-                                # Single frame number
-                                frame_num = int(frame_str)
-                                frame_numbers.append(frame_num)
-                        except ValueError:
-                            pass  # Skip invalid entries
-                
-                if frame_numbers:
-                    frame_range_min = min(frame_numbers)
-                    frame_range_max = max(frame_numbers)
+                # Only the min/max of the existing list matter here, so pull
+                # the endpoints of each frame/range segment without expanding
+                # every range. fullmatch per comma-separated segment keeps the
+                # old skip-bad-entries behavior - a malformed token like
+                # '1a-5' is dropped whole, not mined for digits
+                endpoints = []
+                for segment in self.current_frames.split(','):
+                    if not segment.strip():
+                        continue
+                    match = _FRAME_RANGE_RE.fullmatch(segment)
+                    if not match:
+                        continue
+                    start_frame = int(match.group(1))
+                    end_frame = int(match.group(2)) if match.group(2) else start_frame
+                    if start_frame <= end_frame:
+                        endpoints.append(start_frame)
+                        endpoints.append(end_frame)
+
+                if endpoints:
+                    frame_range_min = min(endpoints)
+                    frame_range_max = max(endpoints)
                     print(f"Using existing frame range: {frame_range_min} - {frame_range_max}")
             except Exception as e:
                 print(f"Could not parse current frames: {e}")
@@ -1631,72 +2143,16 @@ class RENDER_OT_suggest_keyframes(Operator):
         
         # Store original frame to restore later
         original_frame = scene.frame_current
-        
+
+        # No actions at all means no keyframes anywhere - skip the whole
+        # traversal in the common not-yet-animated case
+        if not bpy.data.actions:
+            self.report({'WARNING'}, "No keyframes found")
+            return {'CANCELLED'}
+
         try:
-            keyframes = set()
-            
-            # Collect keyframes from all objects in the scene
-            def collect_keyframes_from_object(obj):
-                """Recursively collect all keyframes from an object's animation data"""
-                frames = set()
-                
-                # Check if object has animation data
-                if obj.animation_data and obj.animation_data.action:
-                    action = obj.animation_data.action
-                    # Iterate through all fcurves in the action
-                    for fcurve in action.fcurves:
-                        # Get all keyframe points
-                        for keyframe_point in fcurve.keyframe_points:
-                            frame = int(keyframe_point.co[0])
-                            frames.add(frame)
-                
-                # Check object data animation (e.g., shape keys, mesh animation)
-                if hasattr(obj, 'data') and obj.data and hasattr(obj.data, 'animation_data') and obj.data.animation_data:
-                    if obj.data.animation_data.action:
-                        action = obj.data.animation_data.action
-                        for fcurve in action.fcurves:
-                            for keyframe_point in fcurve.keyframe_points:
-                                frame = int(keyframe_point.co[0])
-                                frames.add(frame)
-                
-                # Check material animation
-                if hasattr(obj, 'material_slots'):
-                    for mat_slot in obj.material_slots:
-                        if mat_slot.material and mat_slot.material.animation_data:
-                            if mat_slot.material.animation_data.action:
-                                action = mat_slot.material.animation_data.action
-                                for fcurve in action.fcurves:
-                                    for keyframe_point in fcurve.keyframe_points:
-                                        frame = int(keyframe_point.co[0])
-                                        frames.add(frame)
-                
-                return frames
-            
-            # Collect keyframes from all objects
-            object_keyframes = {}
-            for obj in scene.objects:
-                obj_frames = collect_keyframes_from_object(obj)
-                if obj_frames:
-                    object_keyframes[obj.name] = sorted(list(obj_frames))
-                    keyframes.update(obj_frames)
-            
-            # Also check scene animation data (world, scene properties, etc.)
-            if scene.animation_data and scene.animation_data.action:
-                action = scene.animation_data.action
-                for fcurve in action.fcurves:
-                    for keyframe_point in fcurve.keyframe_points:
-                        frame = int(keyframe_point.co[0])
-                        keyframes.add(frame)
-            
-            # Check world animation
-            if scene.world and scene.world.animation_data and scene.world.animation_data.action:
-                action = scene.world.animation_data.action
-                for fcurve in action.fcurves:
-                    for keyframe_point in fcurve.keyframe_points:
-                        frame = int(keyframe_point.co[0])
-                        keyframes.add(frame)
-            
-            # Filter keyframes based on existing frame range or scene frame range
+            # Decide the filter window up front so out-of-range frames can
+            # be dropped during collection instead of afterwards
             if frame_range_min is not None and frame_range_max is not None:
                 # Use the min/max from existing frame list
                 frame_start = frame_range_min
@@ -1707,31 +2163,119 @@ class RENDER_OT_suggest_keyframes(Operator):
                 frame_start = scene.frame_start
                 frame_end = scene.frame_end
                 filter_source = "scene frame range"
+
+            keyframes = set()
+
+            # Linked duplicates and shared rigs reference the same action
+            # from many objects - parse each unique action once per scan
+            # and hand out the cached frame set to every other user
+            action_frame_cache = {}
+
+            def frames_for_action(action):
+                key = action.as_pointer()
+                frames = action_frame_cache.get(key)
+                if frames is None:
+                    frames = _action_keyframes(action)
+                    action_frame_cache[key] = frames
+                return frames
+
+            # Collect keyframes from all objects in the scene
+            def collect_keyframes_from_object(obj):
+                """Recursively collect all keyframes from an object's animation data"""
+                frames = set()
+
+                # EAFP - walk each attribute chain once and let a missing or
+                # None link raise, instead of hasattr chains that pay the
+                # lookups twice whenever the data is actually there
+
+                # Object animation data
+                try:
+                    action = obj.animation_data.action
+                except AttributeError:
+                    action = None
+                if action:
+                    frames.update(frames_for_action(action))
+
+                # Object data animation (e.g., shape keys, mesh animation)
+                # Empties carry no data block, so skip the probe entirely
+                if obj.type != 'EMPTY':
+                    try:
+                        action = obj.data.animation_data.action
+                    except AttributeError:
+                        action = None
+                    if action:
+                        frames.update(frames_for_action(action))
+
+                # Material animation - bail before the loop for the common
+                # case of objects without any material slots
+                material_slots = obj.material_slots
+                if material_slots:
+                    for mat_slot in material_slots:
+                        try:
+                            action = mat_slot.material.animation_data.action
+                        except AttributeError:
+                            action = None
+                        if action:
+                            frames.update(frames_for_action(action))
+
+                return frames
             
-            filtered_keyframes = {frame for frame in keyframes if frame_start <= frame <= frame_end}
-            
+            # The authoritative set always comes from bpy.data.actions:
+            # every keyed datablock's action lives there, one bounded pass
+            # visits each shared action exactly once, and the result is
+            # identical whether or not verbose logging is enabled
+            animated_sources = 0
+            for action in bpy.data.actions:
+                # Bounded collection - frames outside the window never
+                # enter the union set
+                action_frames = _action_keyframes(action, frame_start, frame_end)
+                if action_frames:
+                    animated_sources += 1
+                    keyframes.update(action_frames)
+            animated_object_count = animated_sources
+
+            if _DEBUG:
+                # Per-object walk, kept only for the debug breakdown
+                # printout - it pays RNA attribute probes on every object
+                # but never feeds the result set
+                object_keyframes = {}
+                for obj in scene.objects:
+                    obj_frames = collect_keyframes_from_object(obj)
+                    if obj_frames:
+                        object_keyframes[obj.name] = sorted(obj_frames)
+            else:
+                object_keyframes = None
+
+            # Filter with a vectorized mask instead of a per-frame Python
+            # comparison; np.unique both deduplicates and sorts in one pass
+            keyframe_arr = np.fromiter(keyframes, dtype=np.int32, count=len(keyframes))
+            mask = (keyframe_arr >= frame_start) & (keyframe_arr <= frame_end)
+            sorted_arr = np.unique(keyframe_arr[mask])
+
             # Debug output
-            print(f"=== Keyframe Collection Debug Info ===")
-            print(f"Filter source: {filter_source}")
-            print(f"Filter range: {frame_start} - {frame_end}")
-            print(f"Scene frame range: {scene.frame_start} - {scene.frame_end}")
-            print(f"Objects with keyframes: {len(object_keyframes)}")
-            for obj_name, frames in object_keyframes.items():
-                print(f"  {obj_name}: {frames}")
-            print(f"Total unique keyframes found: {len(keyframes)}")
-            print(f"All keyframes: {sorted(list(keyframes))}")
-            print(f"Filtered keyframes: {sorted(list(filtered_keyframes))}")
-            
-            if filtered_keyframes:
-                # Sort keyframes and create comma-separated string
-                sorted_keyframes = sorted(list(filtered_keyframes))
-                keyframe_string = ','.join(map(str, sorted_keyframes))
+            if _DEBUG:
+                print(f"=== Keyframe Collection Debug Info ===")
+                print(f"Filter source: {filter_source}")
+                print(f"Filter range: {frame_start} - {frame_end}")
+                print(f"Scene frame range: {scene.frame_start} - {scene.frame_end}")
+                print(f"Objects with keyframes: {len(object_keyframes)}")
+                for obj_name, frames in object_keyframes.items():
+                    print(f"  {obj_name}: {frames}")
+                print(f"Total unique keyframes found: {len(keyframes)}")
+                print(f"All keyframes: {sorted(keyframes)}")
+                print(f"Filtered keyframes: {sorted_arr.tolist()}")
+
+            if sorted_arr.size:
+                # Stringify in numpy - np.char.mod formats the whole
+                # array in C instead of one str() call per frame
+                keyframe_string = ','.join(np.char.mod('%d', sorted_arr).tolist())
+                sorted_keyframes = sorted_arr.tolist()
                 
                 # Store keyframes in the window manager to persist across operator calls
-                bpy.types.WindowManager.suggested_keyframes = keyframe_string
+                context.window_manager.suggested_keyframes = keyframe_string
                 
                 range_info = f" (limited to range {frame_start}-{frame_end})" if filter_source == "existing frame list" else ""
-                self.report({'INFO'}, f"Found {len(sorted_keyframes)} keyframes from {len(object_keyframes)} objects{range_info}: {keyframe_string[:80]}{'...' if len(keyframe_string) > 80 else ''}")
+                self.report({'INFO'}, f"Found {len(sorted_keyframes)} keyframes from {animated_object_count} animated sources{range_info}: {keyframe_string[:80]}{'...' if len(keyframe_string) > 80 else ''}")
                 
                 return {'FINISHED'}
             else:
@@ -1740,8 +2284,10 @@ class RENDER_OT_suggest_keyframes(Operator):
                 return {'CANCELLED'}
         
         finally:
-            # Restore original frame
-            scene.frame_set(original_frame)
+            # The scan never moves the playhead itself - only restore (and
+            # pay a full depsgraph update) if something actually changed it
+            if scene.frame_current != original_frame:
+                scene.frame_set(original_frame)
 
 
 class RENDER_PT_specific_frames_panel(Panel):
@@ -1752,8 +2298,13 @@ class RENDER_PT_specific_frames_panel(Panel):
     bl_region_type = 'WINDOW'
     bl_context = "render"
     
-    def draw(self, context):    
-        global output_folder_path
+    def draw(self, context):
+        _ensure_prefs_loaded()
+
+        # Bind the module globals to locals once - draw() runs on every UI
+        # redraw and LOAD_FAST beats repeated LOAD_GLOBAL lookups
+        folder = output_folder_path
+        pattern = filename_pattern
         layout = self.layout
 
         # Output folder section
@@ -1768,9 +2319,12 @@ class RENDER_PT_specific_frames_panel(Panel):
         else:
             source_box.label(text="Storage: User Preferences (global)", icon='PREFERENCES')
 
-        if output_folder_path:
-            col.label(text=f"Current: {os.path.basename(output_folder_path)}", icon='FOLDER_REDIRECT')
-            col.label(text=f"Path: {output_folder_path}")
+        if folder:
+            global _basename_cache
+            if folder is not _basename_cache[0]:
+                _basename_cache = (folder, os.path.basename(folder))
+            col.label(text=f"Current: {_basename_cache[1]}", icon='FOLDER_REDIRECT')
+            col.label(text=f"Path: {folder}")
         else:
             col.label(text="Current: (Blend file directory)", icon='FOLDER_REDIRECT')
             col.label(text="(No default folder set)", icon='INFO')
@@ -1780,57 +2334,69 @@ class RENDER_PT_specific_frames_panel(Panel):
         row.operator("render.set_output_folder", text="Set Output Folder", icon='FILE_FOLDER')
         row.operator("render.browse_output_folder", text="Open Folder", icon='FOLDER_REDIRECT')
 
+        # Channel selection is needed by both the preview and the channel
+        # summary below - read it from the view layer once per redraw
+        scene = context.scene
+        selected_channels = get_selected_channels(scene)
+        num_selected = len(selected_channels)
+
         # Filename pattern section
         layout.separator()
         col = layout.column(align=True)
         col.label(text="Filename Pattern Settings:")
         
-        global filename_pattern
-        if filename_pattern:
+        if pattern:
             # Show current pattern with truncation if too long
-            display_pattern = filename_pattern if len(filename_pattern) <= 35 else filename_pattern[:32] + "..."
+            display_pattern = pattern if len(pattern) <= 35 else pattern[:32] + "..."
             col.label(text=f"Current: {display_pattern}", icon='FILE_TEXT')
             
             # Show a preview of what the filename would look like
             try:
                 # Generate preview filename
-                blend_name = "MyProject" if not bpy.data.filepath else os.path.splitext(os.path.basename(bpy.data.filepath))[0]
-                camera_name = context.scene.camera.name if context.scene.camera else "Camera"
-                view_layer_name = context.scene.view_layers[0].name if context.scene.view_layers else "ViewLayer"
-                frame_num = context.scene.frame_current
-                from datetime import datetime
-                
-                # Show preview with different channels if multiple selected
-                selected_channels = get_selected_channels(context.scene)
-                if len(selected_channels) > 1:
-                    # Show preview for first channel
-                    channel_name = selected_channels[0][0]
-                    preview_filename = generate_filename_from_pattern(
-                        filename_pattern,
-                        blend_name,
-                        camera_name,
-                        frame_num,
-                        start_time=datetime.now(),
-                        end_time=datetime.now(),
-                        channel_name=channel_name,
-                        view_layer_name=view_layer_name
-                    )
-                    col.label(text=f"Preview: {preview_filename}.png", icon='PREVIEW_RANGE')
-                    col.label(text=f"(+ {len(selected_channels)-1} more channels)", icon='INFO')
+                # Memoized on the filepath, so redraws skip the
+                # basename/splitext string work
+                blend_filepath = bpy.data.filepath
+                blend_name = _blend_name(blend_filepath) if blend_filepath else "MyProject"
+                camera_name = scene.camera.name if scene.camera else "Camera"
+                view_layer_name = scene.view_layers[0].name if scene.view_layers else "ViewLayer"
+                frame_num = scene.frame_current
+
+                # Show preview for the first channel if multiple selected
+                channel_name = selected_channels[0] if selected_channels else "Combined"
+
+                # Only re-template when one of the inputs actually changed -
+                # draw() fires on every redraw, the pattern rarely moves.
+                # Patterns with (Start:)/(End:) tokens must preview with a
+                # real, current date, so fold the current minute into the
+                # key to keep it plausible without re-templating every tick
+                global _preview_cache
+                if _DATETIME_TOKEN_RE.search(pattern):
+                    preview_time = datetime.now()
+                    time_bucket = (preview_time.year, preview_time.month, preview_time.day,
+                                   preview_time.hour, preview_time.minute)
+                else:
+                    preview_time = _PREVIEW_TIME
+                    time_bucket = None
+                key = (pattern, blend_name, camera_name, frame_num,
+                       channel_name, view_layer_name, time_bucket)
+                if _preview_cache[0] == key:
+                    preview_filename = _preview_cache[1]
                 else:
-                    # Single channel or default
-                    channel_name = selected_channels[0][0] if selected_channels else "Combined"
                     preview_filename = generate_filename_from_pattern(
-                        filename_pattern,
+                        pattern,
                         blend_name,
                         camera_name,
                         frame_num,
-                        start_time=datetime.now(),
-                        end_time=datetime.now(),
+                        start_time=preview_time,
+                        end_time=preview_time,
                         channel_name=channel_name,
                         view_layer_name=view_layer_name
                     )
-                    col.label(text=f"Preview: {preview_filename}.png", icon='PREVIEW_RANGE')
+                    _preview_cache = (key, preview_filename)
+
+                col.label(text=f"Preview: {preview_filename}.png", icon='PREVIEW_RANGE')
+                if num_selected > 1:
+                    col.label(text=f"(+ {num_selected - 1} more channels)", icon='INFO')
             except Exception:
                 col.label(text="Preview: (Pattern error)", icon='ERROR')
         else:
@@ -1840,19 +2406,16 @@ class RENDER_PT_specific_frames_panel(Panel):
 
         # Render Channels section - Show enabled passes from Blender's view layer
         layout.separator()
-        scene = context.scene
-        selected_channels = get_selected_channels(scene)
-        num_selected = len(selected_channels)
-        
+
         # Compact channel info
         row = layout.row(align=True)
         row.label(text=f"Output Channels: {num_selected}", icon='RENDERLAYERS')
         if num_selected <= 10:
-            channel_names = [ch[0] for ch in selected_channels]
+            channel_names = selected_channels
             row.label(text=f"({', '.join(channel_names)})")
         
         # Warning for multi-channel without (Channel) token
-        if num_selected > 1 and "(Channel)" not in filename_pattern:
+        if num_selected > 1 and "(Channel)" not in pattern:
             row = layout.row()
             row.alert = True
             row.label(text="Add (Channel) token to pattern for multi-pass, only the first pass will be handled now", icon='ERROR')
@@ -1864,6 +2427,11 @@ class RENDER_PT_specific_frames_panel(Panel):
         layout.operator("render.current_frame", text="Render Current Frame", icon='RENDER_STILL')
         layout.operator("render.open_output_folder", text="Open Rendered Frame Result", icon='IMAGE_DATA')
 
+        # Clipboard section (Windows only)
+        if sys.platform == 'win32':
+            layout.operator("render.copy_to_clipboard", text="Copy Render to Clipboard", icon='COPYDOWN')
+            layout.prop(context.scene, "frh_copy_to_clipboard", text="Copy to Clipboard After Render")
+
         # Tips section with toggle button
         layout.separator()
         row = layout.row()
@@ -1900,6 +2468,7 @@ def register():
     bpy.utils.register_class(RENDER_OT_set_filename_pattern)
     bpy.utils.register_class(RENDER_OT_specific_frames)
     bpy.utils.register_class(RENDER_OT_current_frame)
+    bpy.utils.register_class(RENDER_OT_copy_to_clipboard)
     bpy.utils.register_class(RENDER_OT_open_output_folder)
     bpy.utils.register_class(RENDER_OT_suggest_keyframes)
     bpy.utils.register_class(RENDER_PT_specific_frames_panel)
@@ -1910,21 +2479,44 @@ def register():
         description="Toggle visibility of tips section",
         default=False
     )
-    
+    bpy.types.Scene.frh_copy_to_clipboard = BoolProperty(
+        name="Copy to Clipboard After Render",
+        description="Automatically copy the render result to the clipboard after rendering the current frame (Windows only)",
+        default=False
+    )
+    bpy.types.WindowManager.suggested_keyframes = StringProperty(
+        name="Suggested Keyframes",
+        description="Keyframe list handed from the suggest operator to the render dialog",
+        default=""
+    )
+
     # Add handler to reload output folder when file is loaded
     bpy.app.handlers.load_post.append(on_file_load)
-    
-    # Load saved preferences
-    load_user_preferences()
+
+    # Track the path Blender writes each render result to
+    bpy.app.handlers.render_write.append(on_render_write)
+
+    # Preferences load lazily on first panel draw / operator use, keeping
+    # the prefs-file IO off the add-on activation path
+
+    # Pick up a verbose-logging preference persisted from a previous
+    # session - the update callback only fires on toggles
+    prefs = get_addon_preferences()
+    if prefs is not None:
+        _set_debug(prefs.verbose_logging)
 
 
 def unregister():
-    # Remove handler
+    # Remove handlers
     if on_file_load in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.remove(on_file_load)
+    if on_render_write in bpy.app.handlers.render_write:
+        bpy.app.handlers.render_write.remove(on_render_write)
     
     # Unregister scene properties
     del bpy.types.Scene.frh_show_tips
+    del bpy.types.Scene.frh_copy_to_clipboard
+    del bpy.types.WindowManager.suggested_keyframes
     
     bpy.utils.unregister_class(FurionRenderHelperPreferences)
     bpy.utils.unregister_class(RENDER_OT_set_output_folder)
@@ -1932,6 +2524,7 @@ def unregister():
     bpy.utils.unregister_class(RENDER_OT_set_filename_pattern)
     bpy.utils.unregister_class(RENDER_OT_specific_frames)
     bpy.utils.unregister_class(RENDER_OT_current_frame)
+    bpy.utils.unregister_class(RENDER_OT_copy_to_clipboard)
     bpy.utils.unregister_class(RENDER_OT_open_output_folder)
     bpy.utils.unregister_class(RENDER_OT_suggest_keyframes)
     bpy.utils.unregister_class(RENDER_PT_specific_frames_panel)
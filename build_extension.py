@@ -11,15 +11,15 @@ import subprocess
 import shutil
 from datetime import datetime
 
-def create_extension_package():
+def create_extension_package(release=False, use_blender=True):
     """Create a ZIP package of the extension using official tools or manual method"""
     current_dir = os.path.dirname(os.path.abspath(__file__))
-    
+
     print("🔧 Building Furion Render Helper Extension Package...")
     print(f"📁 Source directory: {current_dir}")
-    
+
     # Try to use official Blender build command first
-    blender_executable = shutil.which('blender')
+    blender_executable = shutil.which('blender') if use_blender else None
     if blender_executable:
         print("🚀 Attempting to use official Blender build command...")
         try:
@@ -53,9 +53,11 @@ def create_extension_package():
         except Exception as e:
             print(f"⚠️  Official Blender build - Error: {e}")
             print("⬇️  Falling back to manual ZIP creation...")
-    else:
+    elif use_blender:
         print("ℹ️  Blender not found in PATH - Using manual ZIP creation")
         print("   (Install Blender and add to PATH for official build tools)")
+    else:
+        print("ℹ️  Skipping official Blender build (--no-blender)")
     
     # Manual ZIP creation fallback
     print("\n🔧 Creating extension package manually...")
@@ -87,12 +89,24 @@ def create_extension_package():
     
     print(f"📦 Package name: {package_name}")
     
+    # Dev builds favor speed: level 1 deflate is several times faster than
+    # the default and these small text/source files compress almost as well.
+    # --release bumps to maximum compression for shipping.
+    compresslevel = 9 if release else 1
+
+    # One directory read instead of a stat call per candidate file
+    with os.scandir(current_dir) as entries:
+        present = {entry.name for entry in entries if entry.is_file()}
+
     try:
-        with zipfile.ZipFile(package_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        with zipfile.ZipFile(package_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as zipf:
             for file in files_to_include:
-                file_path = os.path.join(current_dir, file)
-                if os.path.exists(file_path):
-                    zipf.write(file_path, file)
+                if file in present:
+                    # Read the whole (KB-sized) file once and deflate from
+                    # memory - writestr computes CRC and compresses in one
+                    # pass instead of ZipFile.write's open/read/seek loop
+                    with open(os.path.join(current_dir, file), 'rb') as f:
+                        zipf.writestr(file, f.read())
                     print(f"✅ Added: {file}")
                 else:
                     print(f"⚠️  Skipped: {file} (not found)")
@@ -120,5 +134,12 @@ def print_installation_instructions(package_name):
     print(f"   blender --command extension install-file {package_name}")
 
 if __name__ == "__main__":
-    success = create_extension_package()
+    import argparse
+    parser = argparse.ArgumentParser(description="Build the Furion Render Helper extension package")
+    parser.add_argument('--release', action='store_true',
+                        help="Use maximum ZIP compression for a shipping build (slower)")
+    parser.add_argument('--no-blender', action='store_true',
+                        help="Skip the Blender subprocess and go straight to the manual ZIP build")
+    args = parser.parse_args()
+    success = create_extension_package(release=args.release, use_blender=not args.no_blender)
     sys.exit(0 if success else 1)
\ No newline at end of file
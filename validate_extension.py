@@ -4,12 +4,14 @@ Validation script for Furion Render Helper Blender Extension
 Uses both manual checks and official Blender validation when available
 """
 
+import ast
 import os
 import sys
 import subprocess
 import shutil
+import tomllib
 
-def validate_extension():
+def validate_extension(use_blender=True):
     """Validate the extension structure and files"""
     current_dir = os.path.dirname(os.path.abspath(__file__))
     
@@ -27,48 +29,59 @@ def validate_extension():
     
     print("🔍 Validating Furion Render Helper Extension Structure...")
     print(f"📁 Extension directory: {current_dir}")
-    
+
+    # Read the directory once and test every file against the listing -
+    # one scandir instead of a stat syscall per checked file
+    with os.scandir(current_dir) as entries:
+        present = {entry.name for entry in entries if entry.is_file()}
+
     # Check required files
     missing_files = []
     for file in required_files:
-        file_path = os.path.join(current_dir, file)
-        if os.path.exists(file_path):
+        if file in present:
             print(f"✅ {file} - Found")
         else:
             print(f"❌ {file} - Missing")
             missing_files.append(file)
-    
+
     # Check optional files
     for file in optional_files:
-        file_path = os.path.join(current_dir, file)
-        if os.path.exists(file_path):
+        if file in present:
             print(f"✅ {file} - Found (optional)")
         else:
             print(f"⚠️  {file} - Missing (optional)")
-    
-    # Check manifest content
+
+    # Check manifest content - parse the TOML properly instead of substring
+    # matching, which a comment mentioning a field name would false-positive
     manifest_path = os.path.join(current_dir, 'blender_manifest.toml')
-    if os.path.exists(manifest_path):
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+    if 'blender_manifest.toml' in present:
+        try:
+            with open(manifest_path, 'rb') as f:
+                manifest = tomllib.load(f)
+        except tomllib.TOMLDecodeError as e:
+            print(f"❌ blender_manifest.toml - Invalid TOML: {e}")
+            missing_files.append('valid blender_manifest.toml')
+        else:
             # Check for required fields according to official docs
             required_fields = ['schema_version', 'id', 'version', 'name', 'tagline', 'maintainer', 'type', 'blender_version_min', 'license']
-            missing_fields = []
-            for field in required_fields:
-                if field not in content:
-                    missing_fields.append(field)
-            
+            missing_fields = [field for field in required_fields if field not in manifest]
+
             if not missing_fields:
                 print("✅ blender_manifest.toml - All required fields present")
-                
+
                 # Check version format
-                if 'blender_version_min = "4.2.0"' in content or 'blender_version_min = "4.2"' in content:
+                version_min = manifest.get('blender_version_min', '')
+                try:
+                    version_ok = tuple(int(p) for p in version_min.split('.')) >= (4, 2)
+                except ValueError:
+                    version_ok = False
+                if version_ok:
                     print("✅ blender_manifest.toml - Minimum Blender version 4.2.0+ ✓")
                 else:
                     print("⚠️  blender_manifest.toml - Should use blender_version_min = \"4.2.0\" or higher")
-                
+
                 # Check tags
-                if 'tags = ["Render", "Animation"]' in content:
+                if manifest.get('tags') == ["Render", "Animation"]:
                     print("✅ blender_manifest.toml - Uses official supported tags")
                 else:
                     print("⚠️  blender_manifest.toml - Consider using only official supported tags")
@@ -76,22 +89,31 @@ def validate_extension():
                 print(f"❌ blender_manifest.toml - Missing required fields: {', '.join(missing_fields)}")
                 missing_files.extend(missing_fields)
     
-    # Check __init__.py content
+    # Check __init__.py content - walk the AST so commented-out code and
+    # docstrings can't satisfy (or fake) the checks
     init_path = os.path.join(current_dir, '__init__.py')
-    if os.path.exists(init_path):
+    if '__init__.py' in present:
         with open(init_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            required_functions = ['register()', 'unregister()']
-            missing_functions = []
-            for func in required_functions:
-                if func not in content:
-                    missing_functions.append(func)
-            
+            source = f.read()
+        try:
+            tree = ast.parse(source)
+        except SyntaxError as e:
+            print(f"❌ __init__.py - Syntax error: {e}")
+            missing_files.append('parsable __init__.py')
+        else:
+            top_level_defs = {node.name for node in tree.body if isinstance(node, ast.FunctionDef)}
+            missing_functions = [f"{name}()" for name in ('register', 'unregister') if name not in top_level_defs]
+
             if not missing_functions:
                 print("✅ __init__.py - Required functions present")
-                
+
                 # Check for bl_info (for backward compatibility)
-                if 'bl_info' in content:
+                has_bl_info = any(
+                    isinstance(node, ast.Assign)
+                    and any(isinstance(target, ast.Name) and target.id == 'bl_info' for target in node.targets)
+                    for node in tree.body
+                )
+                if has_bl_info:
                     print("✅ __init__.py - bl_info present (backward compatibility)")
                 else:
                     print("ℹ️  __init__.py - No bl_info (extension-only mode)")
@@ -99,10 +121,14 @@ def validate_extension():
                 print(f"❌ __init__.py - Missing required functions: {', '.join(missing_functions)}")
                 missing_files.extend(missing_functions)
     
-    # Try to use official Blender validation if available
-    print("\n🔧 Attempting official Blender validation...")
-    blender_executable = shutil.which('blender')
-    if blender_executable:
+    # Try to use official Blender validation if available. --no-blender
+    # skips the subprocess entirely - the 1-3s Blender startup dominates
+    # an iteration loop where the structural checks above are what matter
+    blender_executable = shutil.which('blender') if use_blender else None
+    if not use_blender:
+        print("\nℹ️  Skipping official Blender validation (--no-blender)")
+    elif blender_executable:
+        print("\n🔧 Attempting official Blender validation...")
         try:
             result = subprocess.run([
                 blender_executable, 
@@ -122,7 +148,7 @@ def validate_extension():
         except Exception as e:
             print(f"⚠️  Official Blender validation - Error: {e}")
     else:
-        print("ℹ️  Blender not found in PATH - Skipping official validation")
+        print("\nℹ️  Blender not found in PATH - Skipping official validation")
         print("   (Install Blender and add to PATH for official validation)")
     
     # Summary
@@ -142,5 +168,10 @@ def validate_extension():
         return True
 
 if __name__ == "__main__":
-    success = validate_extension()
+    import argparse
+    parser = argparse.ArgumentParser(description="Validate the Furion Render Helper extension structure")
+    parser.add_argument('--no-blender', action='store_true',
+                        help="Skip the Blender subprocess and run only the structural checks")
+    args = parser.parse_args()
+    success = validate_extension(use_blender=not args.no_blender)
     sys.exit(0 if success else 1)
\ No newline at end of file